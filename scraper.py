@@ -3,17 +3,28 @@ Web scraper for The Chronicle of Higher Education's DEI tracking table.
 Handles authentication, pagination, and extracting data from expandable rows.
 """
 
+import os
+import re
+import argparse
 import time
 import json
 import csv
-from typing import List, Dict, Optional
+import queue
+import atexit
+import asyncio
+import threading
+import random
+import multiprocessing
+import multiprocessing.util
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import List, Dict, Optional, Tuple
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from selenium.common.exceptions import TimeoutException, NoSuchElementException, StaleElementReferenceException
 from webdriver_manager.chrome import ChromeDriverManager
 import logging
 
@@ -35,17 +46,507 @@ except ImportError:
     logger.warning("tabulate not available. Install with: pip install tabulate")
 
 try:
-    from bs4 import BeautifulSoup
+    from bs4 import BeautifulSoup, SoupStrainer
     BEAUTIFULSOUP_AVAILABLE = True
 except ImportError:
     BEAUTIFULSOUP_AVAILABLE = False
     logger.warning("beautifulsoup4 not available. Install with: pip install beautifulsoup4")
 
+try:
+    import lxml.html  # C parser, used directly and as BeautifulSoup's backend
+    LXML_AVAILABLE = True
+except ImportError:
+    LXML_AVAILABLE = False
+    logger.warning("lxml not available. Install with: pip install lxml")
+
+# BeautifulSoup backend: lxml's C parser when installed, else the pure-Python html.parser
+BS4_PARSER = 'lxml' if LXML_AVAILABLE else 'html.parser'
+
+try:
+    try:
+        from selectolax.lexbor import LexborHTMLParser as HTMLParser
+    except ImportError:
+        # Older selectolax releases without the Lexbor backend
+        from selectolax.parser import HTMLParser
+    SELECTOLAX_AVAILABLE = True
+except ImportError:
+    SELECTOLAX_AVAILABLE = False
+    logger.warning("selectolax not available. Install with: pip install selectolax")
+
+# Whether page HTML can be parsed at all (selectolax, then lxml, then BeautifulSoup)
+HTML_PARSER_AVAILABLE = SELECTOLAX_AVAILABLE or LXML_AVAILABLE or BEAUTIFULSOUP_AVAILABLE
+
+try:
+    import aiohttp
+    AIOHTTP_AVAILABLE = True
+except ImportError:
+    AIOHTTP_AVAILABLE = False
+    logger.warning("aiohttp not available. Install with: pip install aiohttp")
+
+try:
+    import psutil
+    PSUTIL_AVAILABLE = True
+except ImportError:
+    PSUTIL_AVAILABLE = False
+    logger.warning("psutil not available. Install with: pip install psutil")
+
+# Playwright is an optional alternative browser engine (--engine playwright); no warning when missing
+try:
+    from playwright.sync_api import sync_playwright, TimeoutError as PlaywrightTimeoutError
+    PLAYWRIGHT_AVAILABLE = True
+except ImportError:
+    PLAYWRIGHT_AVAILABLE = False
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    logger.warning("orjson not available. Install with: pip install orjson")
+
+# User agent to appear more like a real browser (shared by Chrome and aiohttp)
+USER_AGENT = 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+
+# HTTP statuses worth retrying (rate limiting / transient server errors)
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+# Safety cap on pages scraped per run, whether clicking through pages or requesting page_url
+PAGE_LIMIT = 20
+
+# Poll interval (seconds) for explicit waits on DOM state changes; WebDriverWait's default is 0.5
+WAIT_POLL = 0.05
+
+# Clicks every collapsed result row in one round-trip, using the same targets as expand_row:
+# the first visible toggle in the first cell (selectors tried in priority order, so a toggle
+# button wins over an institution link), else the first cell, else the row itself.
+# Rows already showing their details are skipped (same test as _COLLAPSED_ROW_IDS_JS), so
+# running it again doesn't toggle them shut
+_EXPAND_ALL_JS = """
+const toggles = ["button", "[role='button']", "a", ".toggle", ".expand", ".collapse", "[class*='toggle']",
+                 "[class*='expand']", "[class*='icon']", "span[class*='icon']", "span[class*='chevron']"];
+let clicked = 0;
+document.querySelectorAll('tr.result:not(.opened)').forEach(row => {
+    const details = document.getElementById('details_' + row.id);
+    if (details !== null && details.offsetParent !== null) return;
+    const cell = row.querySelector('td:first-child');
+    let btn = null;
+    for (const sel of (cell ? toggles : [])) {
+        const el = cell.querySelector(sel);
+        if (el && el.offsetParent !== null) { btn = el; break; }
+    }
+    (btn || cell || row).click();
+    clicked++;
+});
+return clicked;
+"""
+
+# Visibility and identifying attributes for a list of elements, read in one round-trip
+_ELEMENT_INFO_JS = """
+return Array.from(arguments[0]).map(el => ({
+    visible: !!(el.offsetWidth || el.offsetHeight || el.getClientRects().length),
+    disabled: el.disabled === true || el.getAttribute('aria-disabled') === 'true',
+    label: el.getAttribute('aria-label') || '',
+    attrs: [el.getAttribute('class'), el.dataset.page, el.dataset.action].join(' '),
+    text: (el.innerText || '').trim()
+}));
+"""
+
+# Ids of result rows that are neither marked opened nor showing a visible details row
+# (an empty list means the whole page is expanded), snapshotted in one round-trip
+_COLLAPSED_ROW_IDS_JS = """
+return Array.from(document.querySelectorAll('tr.result')).filter(row => {
+    if (row.classList.contains('opened')) return false;
+    const details = document.getElementById('details_' + row.id);
+    return details === null || details.offsetParent === null;
+}).map(row => row.id);
+"""
+
+# Text of the pagination info (like "Showing 1–25 of 300") and the number of page controls,
+# read in one round-trip
+_PAGINATION_JS = """
+const info = document.querySelector(".pagination-info, [class*='pagination'], [class*='count']");
+return [info ? info.innerText : null, document.querySelectorAll(".page-number, [class*='page']").length];
+"""
+
+# Cell text, source links and raw details text of every result row, read in one round-trip.
+# Text is the trimmed text nodes joined like get_text(separator, strip=True), and links are the
+# raw href attributes rather than resolved URLs, so rows match the HTML parser paths
+_BULK_EXTRACT_JS = """
+const text = (el, sep = '') => {
+    const parts = [];
+    const walker = el ? document.createTreeWalker(el, NodeFilter.SHOW_TEXT) : null;
+    for (let node = walker && walker.nextNode(); node; node = walker.nextNode()) {
+        const t = node.nodeValue.trim();
+        if (t) parts.push(t);
+    }
+    return parts.join(sep);
+};
+return Array.from(document.querySelectorAll('tr.result')).filter(r => r.id).map(r => {
+    const cells = r.querySelectorAll('td');
+    const links = cells[3] ? Array.from(cells[3].querySelectorAll('a[href]')).map(a => a.getAttribute('href')) : [];
+    const details = document.getElementById('details_' + r.id);
+    const detailsCell = details && details.querySelector('td.details');
+    return {row_id: r.id, num_cells: cells.length, institution: text(cells[0]), state: text(cells[1]),
+            impacts: text(cells[2]), source: text(cells[3]), source_links: links,
+            details_raw: text(detailsCell, '\\n')};
+});
+"""
+
+# Common selectors for the login link, login form fields, results table and "next page" controls
+LOGIN_SELECTORS = [
+    "a[href*='login']",
+    "a[href*='sign-in']",
+    "a[aria-label*='Log In' i]",
+    "button[aria-label*='Sign In' i]",
+    ".login",
+    "#login",
+    "[data-testid='login']"
+]
+EMAIL_SELECTORS = [
+    "input[type='email']",
+    "input[name='email']",
+    "input[name='username']",
+    "input[id*='email']",
+    "input[id*='username']",
+    "#email",
+    "#username"
+]
+SUBMIT_SELECTORS = [
+    "button[type='submit']",
+    "input[type='submit']",
+    "button[aria-label*='Sign In' i]",
+    "button[aria-label*='Log In' i]",
+    ".submit-button"
+]
+TABLE_SELECTORS = [
+    "table",
+    ".table",
+    "[data-testid='table']",
+    ".data-table",
+    "tbody"
+]
+# aria-label, class names, data attributes, and pagination links (filtered by text in rank_next_candidates)
+NEXT_SELECTORS = [
+    "button[aria-label*='next' i]", "a[aria-label*='next' i]",
+    "[class*='next']",
+    "[data-page='next']", "[data-action='next']",
+    "[class*='pagination'] a", "[class*='pagination'] button", "[class*='pager'] a"
+]
+
+# Labels of the bold headings inside a details cell (BeautifulSoup matches compiled patterns natively)
+_DETAILS_RE = re.compile(r'Details')
+_STATUS_RE = re.compile(r'status:', re.I)
+# Ids of the details rows that follow each result row
+_DETAILS_ID_RE = re.compile(r'^details_')
+
+# Total row count in pagination text like "Showing 1–25 of 300"
+_PAGES_RE = re.compile(r'of\s+(\d+)')
+
+# Requests Chrome skips when resource blocking is on: images, web fonts, ads and analytics.
+# Stylesheets stay enabled because row expansion is detected through computed visibility.
+BLOCKED_URL_PATTERNS = [
+    '*.jpg', '*.jpeg', '*.png', '*.gif', '*.webp', '*.woff', '*.woff2', '*.ttf',
+    '*googletagmanager*', '*google-analytics*', '*doubleclick*', '*analytics*'
+]
+
+# Column order for CSV output
+CSV_FIELDNAMES = ["institution", "state", "impacts", "source", "source_links", "details", "state_status", "row_id"]
+
+# ChromeDriver binary path, resolved once per process by webdriver-manager
+_chromedriver_path = None
+
+
+def get_chromedriver_path() -> str:
+    """Return the ChromeDriver path, downloading/resolving it only on first use."""
+    global _chromedriver_path
+    if _chromedriver_path is None:
+        _chromedriver_path = ChromeDriverManager().install()
+    return _chromedriver_path
+
+
+def build_chrome_options(headless: bool, block_resources: bool = True) -> Options:
+    """Build Chrome options for the scraper's browsers."""
+    chrome_options = Options()
+    if headless:
+        # New headless mode: the real browser without a window, lighter than the legacy implementation
+        chrome_options.add_argument('--headless=new')
+    
+    # Trim startup work and per-browser memory: no GPU process, extensions, background services
+    for arg in ('--disable-gpu', '--disable-extensions', '--disable-background-networking',
+                '--disable-sync', '--disable-default-apps', '--mute-audio',
+                '--disable-features=TranslateUI', '--renderer-process-limit=2'):
+        chrome_options.add_argument(arg)
+    if block_resources:
+        chrome_options.add_argument('--blink-settings=imagesEnabled=false')
+        # Also block images at the content-settings level, so no image request is even issued
+        chrome_options.add_experimental_option('prefs', {'profile.managed_default_content_settings.images': 2})
+    # Pages prefetched into background tabs (tabs mode) should load at full speed
+    for arg in ('--disable-background-timer-throttling', '--disable-renderer-backgrounding',
+                '--disable-backgrounding-occluded-windows', '--disable-popup-blocking'):
+        chrome_options.add_argument(arg)
+    chrome_options.add_argument('--no-sandbox')
+    chrome_options.add_argument('--disable-dev-shm-usage')
+    chrome_options.add_argument('--disable-blink-features=AutomationControlled')
+    chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
+    chrome_options.add_experimental_option('useAutomationExtension', False)
+    
+    # User agent to appear more like a real browser
+    chrome_options.add_argument(f'user-agent={USER_AGENT}')
+    return chrome_options
+
+
+def quit_driver(driver):
+    """Quit a WebDriver and kill any Chrome child processes it leaves behind."""
+    children = []
+    if PSUTIL_AVAILABLE:
+        try:
+            children = psutil.Process(driver.service.process.pid).children(recursive=True)
+        except Exception as e:
+            logger.debug(f"Could not list ChromeDriver child processes: {e}")
+    try:
+        driver.quit()
+    except Exception as e:
+        logger.debug(f"Error quitting WebDriver: {e}")
+    for child in children:
+        try:
+            child.kill()
+        except psutil.Error:
+            pass
+
+
+class BrowserPool:
+    """
+    Pool of reusable Chrome WebDriver instances.
+    Launching Chrome takes seconds, so scrapers hand their driver back on close() and the
+    next scraper reuses it. Each driver is quit after recycle_after uses to cap the memory
+    ChromeDriver/Chrome accumulate over long-lived sessions; replacements launch on demand.
+    """
+    
+    def __init__(self, pool_size: int = 4, recycle_after: int = 100):
+        """
+        Args:
+            pool_size: Maximum number of idle drivers kept per browser mode
+            recycle_after: Number of acquisitions after which a driver is quit
+        """
+        self.pool_size = pool_size
+        self.recycle_after = recycle_after
+        self._idle = {}  # (headless, block_resources) -> queue.Queue of idle drivers
+        self._use_counts = {}  # driver -> number of times acquired
+        self._modes = {}  # driver -> (headless, block_resources) it was launched with
+    
+    def _idle_queue(self, mode: tuple) -> queue.Queue:
+        return self._idle.setdefault(mode, queue.Queue(maxsize=self.pool_size))
+    
+    def _launch(self, headless: bool, block_resources: bool):
+        service = Service(get_chromedriver_path())
+        driver = webdriver.Chrome(service=service, options=build_chrome_options(headless, block_resources))
+        driver.maximize_window()
+        # Explicit waits only: a non-zero implicit wait would stall every negative lookup
+        driver.implicitly_wait(0)
+        if block_resources:
+            try:
+                driver.execute_cdp_cmd('Network.enable', {})
+                driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': BLOCKED_URL_PATTERNS})
+            except Exception as e:
+                logger.debug(f"Could not block resources via CDP: {e}")
+        self._use_counts[driver] = 0
+        self._modes[driver] = (headless, block_resources)
+        logger.info("Chrome WebDriver initialized successfully")
+        return driver
+    
+    def acquire(self, headless: bool = False, block_resources: bool = True):
+        """Return an idle driver for the given mode, launching a new one if none is free."""
+        try:
+            driver = self._idle_queue((headless, block_resources)).get_nowait()
+        except queue.Empty:
+            driver = self._launch(headless, block_resources)
+        self._use_counts[driver] += 1
+        return driver
+    
+    def release(self, driver):
+        """Return a driver to the pool, or quit it if it is due for recycling or the pool is full."""
+        if self._use_counts.get(driver, 0) >= self.recycle_after:
+            logger.info(f"Recycling browser after {self.recycle_after} uses")
+            self.retire(driver)
+            return
+        try:
+            self._idle_queue(self._modes.get(driver, (False, True))).put_nowait(driver)
+        except queue.Full:
+            self.retire(driver)
+    
+    def retire(self, driver):
+        """Quit a driver and forget it."""
+        self._use_counts.pop(driver, None)
+        self._modes.pop(driver, None)
+        quit_driver(driver)
+    
+    def shutdown(self):
+        """Quit all idle drivers."""
+        for idle in self._idle.values():
+            while True:
+                try:
+                    driver = idle.get_nowait()
+                except queue.Empty:
+                    break
+                self.retire(driver)
+                logger.info("Browser closed")
+
+
+BROWSER_POOL = BrowserPool(recycle_after=int(os.environ.get('BROWSER_POOL_RECYCLE_AFTER', '100')))
+atexit.register(BROWSER_POOL.shutdown)
+
+
+def to_csv_row(row: Dict) -> Dict:
+    """Copy a scraped row with source_links flattened to a '; '-separated string for CSV."""
+    row_copy = row.copy()
+    row_copy['source_links'] = '; '.join(row_copy.get('source_links', []))
+    return row_copy
+
+
+def _trunc(text: str, limit: int) -> str:
+    """Cut text to limit characters, marking the cut with '...'."""
+    return text[:limit] + '...' if len(text) > limit else text
+
+
+def rank_next_candidates(infos: List[Dict]) -> List[int]:
+    """
+    Order "next page" candidates (as described by _ELEMENT_INFO_JS) best first, dropping
+    hidden or disabled ones: aria-label, then link text, then class/data attributes.
+    
+    Returns:
+        Indexes into infos
+    """
+    ranked = []
+    for i, info in enumerate(infos):
+        if not info['visible'] or info['disabled']:
+            continue
+        text = info['text']
+        if "next" in info['label'].lower():
+            ranked.append((0, i))
+        elif text.lower().startswith("next") or text in ("»", "›"):
+            ranked.append((1, i))
+        elif "next" in info['attrs'].lower():
+            ranked.append((2, i))
+    return [i for _, i in sorted(ranked)]
+
+
+def parse_details_text(text: str) -> Tuple[str, str]:
+    """
+    Split a details cell's text into its details and state status.
+    The cell reads "Details", the details text, then "State status: ..." (the status may
+    continue on the following lines); surrounding quotes are dropped.
+    
+    Args:
+        text: Cell text with one line per text node (e.g. get_text(separator='\\n'))
+        
+    Returns:
+        Tuple of (details, state_status)
+    """
+    lines = [line.strip() for line in text.split('\n') if line.strip()]
+    status_idx = next((i for i, line in enumerate(lines) if _STATUS_RE.search(line)), len(lines))
+    details_idx = next((i for i, line in enumerate(lines[:status_idx]) if _DETAILS_RE.search(line)), -1)
+    
+    details_parts = [line.strip('"') for line in lines[details_idx + 1:status_idx]]
+    status_parts = []
+    if status_idx < len(lines):
+        status_parts = [lines[status_idx].split(':', 1)[1]] + lines[status_idx + 1:]
+    
+    details = ' '.join(part for part in details_parts if part)
+    state_status = ' '.join(part.strip().strip('"') for part in status_parts if part.strip().strip('"'))
+    return details, state_status
+
+
+class RowStream:
+    """
+    Writes scraped rows to CSV, JSON and/or JSON Lines as each page is extracted,
+    so partial results are already on disk if a later page fails.
+    """
+    
+    def __init__(self, csv_path: Optional[str] = None, jsonl_path: Optional[str] = None,
+                 json_path: Optional[str] = None):
+        """
+        Args:
+            csv_path: CSV file to stream rows to (None to skip)
+            jsonl_path: JSON Lines file to stream rows to (None to skip)
+            json_path: JSON array file to stream rows to (None to skip); the closing
+                bracket is written on close, matching save_to_json's layout
+        """
+        self.count = 0
+        self._files = []
+        self._csv_writer = None
+        self._jsonl_file = None
+        self._json_file = None
+        if csv_path:
+            csv_file = open(csv_path, 'w', newline='', encoding='utf-8')
+            self._files.append(csv_file)
+            self._csv_writer = csv.DictWriter(csv_file, fieldnames=CSV_FIELDNAMES)
+            self._csv_writer.writeheader()
+        if jsonl_path:
+            self._jsonl_file = open(jsonl_path, 'w', encoding='utf-8')
+            self._files.append(self._jsonl_file)
+        if json_path:
+            self._json_file = open(json_path, 'w', encoding='utf-8')
+            self._files.append(self._json_file)
+            self._json_file.write('[')
+        # Pages that finished ahead of an earlier one, held until that page is written
+        self._pending = {}
+        self._next_page = 1
+    
+    def write_rows(self, rows: List[Dict]):
+        """Append one page of rows and flush them to disk."""
+        for row in rows:
+            if self._csv_writer:
+                self._csv_writer.writerow(to_csv_row(row))
+            if self._jsonl_file:
+                self._jsonl_file.write(json.dumps(row, ensure_ascii=False) + '\n')
+            if self._json_file:
+                # Indent each element one level so the file reads like json.dump(data, indent=2)
+                item = json.dumps(row, indent=2, ensure_ascii=False).replace('\n', '\n  ')
+                self._json_file.write((',\n  ' if self.count else '\n  ') + item)
+            self.count += 1
+        for f in self._files:
+            f.flush()
+    
+    def write_page(self, page_num: int, rows: List[Dict]):
+        """
+        Append a numbered page (1-based) once every page before it has been written.
+        Concurrent fetchers finish pages out of order; buffering them keeps the files in
+        page order, the same order scrape_all returns the rows in.
+        """
+        if page_num < self._next_page:
+            return
+        self._pending[page_num] = rows
+        while self._next_page in self._pending:
+            self.write_rows(self._pending.pop(self._next_page))
+            self._next_page += 1
+    
+    def close(self):
+        # A page that never arrived shouldn't keep the ones after it off disk
+        for page_num in sorted(self._pending):
+            self.write_rows(self._pending.pop(page_num))
+        if self._json_file and not self._json_file.closed:
+            self._json_file.write('\n]' if self.count else ']')
+        for f in self._files:
+            f.close()
+        self._files = []
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+class LoginError(Exception):
+    """Raised when the login form can't be completed and manual login is disabled."""
+
 
 class ChronicleScraper:
     """Scraper for Chronicle DEI tracking table."""
     
-    def __init__(self, headless: bool = False, wait_time: int = 10, fast: bool = False):
+    def __init__(self, headless: bool = False, wait_time: int = 10, fast: bool = False,
+                 page_url: Optional[str] = None, concurrency: int = 8, max_retries: int = 5,
+                 block_resources: bool = True, workers: int = 1, tabs: int = 1):
         """
         Initialize the scraper.
         
@@ -53,37 +554,53 @@ class ChronicleScraper:
             headless: Run browser in headless mode (default: False for debugging)
             wait_time: Maximum wait time for elements to load (seconds)
             fast: Use shorter delays (faster scrape, slightly higher risk of missed content)
+            page_url: URL template with a '{page}' placeholder for the table's paginated
+                HTML endpoint. When set (and aiohttp is installed), pages are fetched
+                concurrently over HTTP using the browser's cookies instead of clicking
+                through them in Chrome.
+            concurrency: Maximum number of page requests in flight at once (page_url mode)
+            max_retries: Attempts per page before giving up, with exponential backoff (page_url mode)
+            block_resources: Skip loading images, fonts and ad/analytics scripts in Chrome
+            workers: Number of headless browser processes that render pages in parallel
+                (page_url mode; 1 fetches pages over HTTP instead)
+            tabs: Number of browser tabs that load pages concurrently in this scraper's own
+                browser (page_url mode; lighter than separate worker processes)
         """
+        # A zero semaphore or retry budget would hang or fail every page_url fetch
+        for name, value in (('concurrency', concurrency), ('max_retries', max_retries),
+                            ('workers', workers), ('tabs', tabs)):
+            if value < 1:
+                raise ValueError(f"{name} must be at least 1, got {value}")
         self.url = "https://www.chronicle.com/article/tracking-higher-eds-dismantling-of-dei"
         self.wait_time = wait_time
         self.fast = fast
+        self.page_url = page_url
+        self.concurrency = concurrency
+        self.max_retries = max_retries
+        self.block_resources = block_resources
+        self.workers = workers
+        self.tabs = tabs
+        self.session = None  # aiohttp session, open only while pages are fetched over HTTP
         self.driver = None
         self.setup_driver(headless)
         
     def setup_driver(self, headless: bool):
-        """Setup Chrome WebDriver with appropriate options."""
-        chrome_options = Options()
-        if headless:
-            chrome_options.add_argument('--headless')
-        chrome_options.add_argument('--no-sandbox')
-        chrome_options.add_argument('--disable-dev-shm-usage')
-        chrome_options.add_argument('--disable-blink-features=AutomationControlled')
-        chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
-        chrome_options.add_experimental_option('useAutomationExtension', False)
-        
-        # User agent to appear more like a real browser
-        chrome_options.add_argument('user-agent=Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36')
-        
+        """Acquire a Chrome WebDriver from the shared browser pool."""
         try:
-            # Use webdriver-manager to automatically handle ChromeDriver
-            service = Service(ChromeDriverManager().install())
-            self.driver = webdriver.Chrome(service=service, options=chrome_options)
-            self.driver.maximize_window()
-            logger.info("Chrome WebDriver initialized successfully")
+            self.driver = BROWSER_POOL.acquire(headless, self.block_resources)
         except Exception as e:
             logger.error(f"Failed to initialize WebDriver: {e}")
             raise
     
+    def open_table(self):
+        """Navigate to the page with the tracking table."""
+        logger.info("Navigating to Chronicle website...")
+        self.driver.get(self.url)
+    
+    def run_script(self, script: str, *args):
+        """Run a JavaScript function body (which may use return and arguments[i]) in the page."""
+        return self.driver.execute_script(script, *args)
+    
     def login(self, email: str, password: str):
         """
         Login to Chronicle website.
@@ -92,138 +609,106 @@ class ChronicleScraper:
             email: Chronicle account email
             password: Chronicle account password
         """
-        logger.info("Navigating to Chronicle website...")
-        self.driver.get(self.url)
-        time.sleep(3)  # Wait for page to load
+        self.open_table()
+        self._wait_for_load(3)
         
         try:
-            # Look for login button/link
-            # Common selectors for login elements
-            login_selectors = [
-                "a[href*='login']",
-                "a[href*='sign-in']",
-                "button:contains('Sign In')",
-                "a:contains('Log In')",
-                ".login",
-                "#login",
-                "[data-testid='login']"
-            ]
-            
-            login_element = None
-            for selector in login_selectors:
-                try:
-                    if ':contains(' in selector:
-                        # Use XPath for text-based search
-                        text = selector.split("'")[1]
-                        login_element = self.driver.find_element(By.XPATH, f"//a[contains(text(), '{text}')]")
-                    else:
-                        login_element = self.driver.find_element(By.CSS_SELECTOR, selector)
-                    if login_element:
-                        break
-                except NoSuchElementException:
-                    continue
+            # Look for login button/link (common selectors, matched in a single lookup)
+            login_element = self._find_first(", ".join(LOGIN_SELECTORS),
+                                             "//a[contains(text(), 'Sign In') or contains(text(), 'Log In')]")
             
             if login_element:
                 logger.info("Clicking login button...")
                 login_element.click()
-                time.sleep(2)
+                self._wait_for_load(2)
             
-            # Wait for login form and fill credentials
-            wait = WebDriverWait(self.driver, self.wait_time)
-            
-            # Try to find email/username field
-            email_selectors = [
-                "input[type='email']",
-                "input[name='email']",
-                "input[name='username']",
-                "input[id*='email']",
-                "input[id*='username']",
-                "#email",
-                "#username"
-            ]
-            
-            email_field = None
-            for selector in email_selectors:
-                try:
-                    email_field = wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, selector)))
-                    if email_field:
-                        break
-                except TimeoutException:
-                    continue
+            # Wait for the email/username field of the login form
+            email_field = self._wait_for_element(", ".join(EMAIL_SELECTORS))
             
             if not email_field:
                 logger.warning("Could not find email field. Page might already be logged in or structure is different.")
-                logger.info("Please manually log in if needed, then press Enter to continue...")
-                input("Press Enter after logging in...")
+                self._manual_login("Could not locate login form")
                 return
             
             logger.info("Filling in credentials...")
-            email_field.clear()
-            email_field.send_keys(email)
-            time.sleep(1)
+            self._fill(email_field, email)
+            self._wait_for_load(1)
             
             # Find password field
-            password_field = self.driver.find_element(By.CSS_SELECTOR, "input[type='password']")
-            password_field.clear()
-            password_field.send_keys(password)
-            time.sleep(1)
+            password_field = self._find_first("input[type='password']")
+            if not password_field:
+                raise NoSuchElementException("password field not found")
+            self._fill(password_field, password)
+            self._wait_for_load(1)
             
             # Find and click submit button
-            submit_selectors = [
-                "button[type='submit']",
-                "input[type='submit']",
-                "button:contains('Sign In')",
-                "button:contains('Log In')",
-                ".submit-button"
-            ]
-            
-            submit_button = None
-            for selector in submit_selectors:
-                try:
-                    if ':contains(' in selector:
-                        text = selector.split("'")[1]
-                        submit_button = self.driver.find_element(By.XPATH, f"//button[contains(text(), '{text}')]")
-                    else:
-                        submit_button = self.driver.find_element(By.CSS_SELECTOR, selector)
-                    if submit_button:
-                        break
-                except NoSuchElementException:
-                    continue
+            submit_button = self._find_first(", ".join(SUBMIT_SELECTORS),
+                                             "//button[contains(text(), 'Sign In') or contains(text(), 'Log In')]")
             
             if submit_button:
                 submit_button.click()
                 logger.info("Submitted login form. Waiting for page to load...")
-                time.sleep(5)
+                self._wait_for_load(5)
             else:
                 logger.warning("Could not find submit button. Please submit manually.")
-                input("Press Enter after logging in...")
+                self._manual_login("Could not locate login submit button")
                 
+        except LoginError:
+            raise
         except Exception as e:
             logger.error(f"Error during login: {e}")
             logger.info("Attempting to continue - page might already be accessible or login handled differently")
-            time.sleep(3)
+            self._wait_for_load(3)
+    
+    def _manual_login(self, reason: str):
+        """
+        Fall back to logging in by hand in the browser window. Only blocks on input()
+        when INTERACTIVE_LOGIN=1, so unattended runs fail fast instead of hanging.
+        
+        Args:
+            reason: What went wrong with the automated login
+        """
+        if os.environ.get('INTERACTIVE_LOGIN') == '1':
+            logger.info("Please manually log in if needed, then press Enter to continue...")
+            input("Press Enter after logging in...")
+            return
+        logger.error(f"{reason}; set INTERACTIVE_LOGIN=1 to log in manually")
+        raise LoginError(f"{reason}; run with INTERACTIVE_LOGIN=1 for manual fallback")
+    
+    def _find_first(self, css: str, xpath_fallback: Optional[str] = None):
+        """
+        Return the first element matching a (comma-separated) CSS selector list, or None.
+        The text-based XPath fallback is only evaluated when the CSS lookup finds nothing.
+        """
+        elements = self.driver.find_elements(By.CSS_SELECTOR, css)
+        if not elements and xpath_fallback:
+            elements = self.driver.find_elements(By.XPATH, xpath_fallback)
+        return elements[0] if elements else None
+    
+    def _wait_for_element(self, css: str):
+        """Wait up to wait_time for an element matching css to be in the page; returns it, or None on timeout."""
+        try:
+            return WebDriverWait(self.driver, self.wait_time).until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, css)))
+        except TimeoutException:
+            return None
+    
+    def _fill(self, field, text: str):
+        """Replace the contents of an input field with text."""
+        field.clear()
+        field.send_keys(text)
+    
+    def _wait_for_load(self, seconds: float):
+        """Give the page time to react to an action (WebDriver has no signal for this, so sleep)."""
+        time.sleep(seconds)
     
     def wait_for_table(self):
         """Wait for the data table to load."""
         logger.info("Waiting for table to load...")
-        wait = WebDriverWait(self.driver, self.wait_time)
-        
-        # Common table selectors
-        table_selectors = [
-            "table",
-            ".table",
-            "[data-testid='table']",
-            ".data-table",
-            "tbody"
-        ]
-        
-        for selector in table_selectors:
-            try:
-                wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, selector)))
-                logger.info(f"Table found using selector: {selector}")
-                return True
-            except TimeoutException:
-                continue
+        # Common table selectors, waited on as one selector list
+        if self._wait_for_element(", ".join(TABLE_SELECTORS)):
+            logger.info("Table found")
+            return True
         
         logger.warning("Could not find table with standard selectors. Continuing anyway...")
         return False
@@ -238,10 +723,10 @@ class ChronicleScraper:
             classes = row_element.get_attribute('class') or ''
             if 'opened' in classes:
                 return True
+            row_id = row_element.get_attribute('id')
             
             # Scroll row into view so it's clickable
             self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", row_element)
-            time.sleep(0.2 if self.fast else 0.4)
             
             # Strategy 1: Click a toggle/expand control inside the first cell (common in data tables)
             try:
@@ -255,7 +740,7 @@ class ChronicleScraper:
                         btn = first_cell.find_element(By.CSS_SELECTOR, selector)
                         if btn.is_displayed():
                             self.driver.execute_script("arguments[0].click();", btn)
-                            time.sleep(0.5 if self.fast else 1)
+                            self._wait_for_expanded(row_element, row_id)
                             return True
                     except NoSuchElementException:
                         continue
@@ -266,24 +751,97 @@ class ChronicleScraper:
             try:
                 first_cell = row_element.find_element(By.CSS_SELECTOR, "td:first-child")
                 self.driver.execute_script("arguments[0].click();", first_cell)
-                time.sleep(0.5 if self.fast else 1)
+                self._wait_for_expanded(row_element, row_id)
                 return True
             except Exception:
                 pass
             
             # Strategy 3: Click the row itself
             self.driver.execute_script("arguments[0].click();", row_element)
-            time.sleep(0.5 if self.fast else 1)
+            self._wait_for_expanded(row_element, row_id)
             return True
                 
         except Exception as e:
             logger.debug(f"Could not expand row: {e}")
         return False
     
-    def parse_html_with_beautifulsoup(self) -> Optional[BeautifulSoup]:
+    def expand_all_rows(self):
+        """
+        Expand every result row on the current page.
+        Clicks all rows with a single execute_script call and waits once for them to open;
+        if that fails, falls back to expand_row for each row that is still collapsed.
+        """
+        try:
+            clicked = self.driver.execute_script(_EXPAND_ALL_JS)
+            WebDriverWait(self.driver, self.wait_time, poll_frequency=WAIT_POLL).until(
+                lambda d: not d.execute_script(_COLLAPSED_ROW_IDS_JS))
+            logger.debug(f"Batch-expanded {clicked} rows")
+            return
+        except Exception as e:
+            logger.debug(f"Batch expand failed, expanding rows one by one: {e}")
+        
+        # Expand rows one at a time, looking each up by its id (the browser's id index) so
+        # expanding one row doesn't leave us holding stale references to the others
+        row_ids = [row_id for row_id in self.driver.execute_script(_COLLAPSED_ROW_IDS_JS) if row_id]
+        if not row_ids:
+            return
+        for row_id in row_ids:
+            try:
+                # expand_row waits for this row's details to appear, so no fixed delay between rows
+                self.expand_row(self.driver.find_element(By.ID, row_id))
+            except Exception as e:
+                logger.debug(f"Expand row {row_id}: {e}")
+                continue
+        
+        # Let details rows render: return as soon as none are left collapsed, waiting at most
+        # as long as the old fixed delay
+        try:
+            WebDriverWait(self.driver, 0.5 if self.fast else 2, poll_frequency=WAIT_POLL).until(
+                lambda d: not d.execute_script(_COLLAPSED_ROW_IDS_JS))
+        except TimeoutException:
+            logger.debug("Some rows still look collapsed after expanding one by one")
+    
+    def _wait_for_expanded(self, row_element, row_id: Optional[str], timeout: float = 2) -> bool:
+        """
+        Wait until a clicked row is marked 'opened' or its details row is visible.
+        Returns as soon as the DOM changes instead of sleeping a fixed delay.
+        """
+        def expanded(driver):
+            if 'opened' in (row_element.get_attribute('class') or ''):
+                return True
+            details_rows = driver.find_elements(By.ID, f"details_{row_id}") if row_id else []
+            return bool(details_rows) and details_rows[0].is_displayed()
+        
+        try:
+            WebDriverWait(self.driver, timeout, poll_frequency=WAIT_POLL).until(expanded)
+            return True
+        except TimeoutException:
+            logger.debug(f"Row {row_id} did not show as expanded within {timeout}s")
+            return False
+    
+    def get_page_html(self) -> str:
+        """
+        Get the current page HTML.
+        Reads the document's outer HTML over the Chrome DevTools Protocol, which skips
+        Selenium's page_source wrapper; falls back to page_source if CDP is unavailable.
+        """
+        try:
+            root = self.driver.execute_cdp_cmd('DOM.getDocument', {'depth': 0})['root']['nodeId']
+            return self.driver.execute_cdp_cmd('DOM.getOuterHTML', {'nodeId': root})['outerHTML']
+        except Exception as e:
+            logger.debug(f"CDP HTML fetch failed, using page_source: {e}")
+            return self.driver.page_source
+    
+    def parse_html_with_beautifulsoup(self, html: Optional[str] = None,
+                                      rows_only: bool = True) -> Optional[BeautifulSoup]:
         """
         Get the current page HTML and parse it with BeautifulSoup.
         
+        Args:
+            html: Page HTML already captured by the caller (read from the browser if None)
+            rows_only: Build the tree from <tr> elements (and their contents) only,
+                skipping scripts, navigation and the rest of the page
+        
         Returns:
             BeautifulSoup object or None if BeautifulSoup not available
         """
@@ -291,13 +849,15 @@ class ChronicleScraper:
             return None
         
         try:
-            html = self.driver.page_source
-            return BeautifulSoup(html, 'html.parser')
+            if html is None:
+                html = self.get_page_html()
+            return BeautifulSoup(html, BS4_PARSER, parse_only=SoupStrainer('tr') if rows_only else None)
         except Exception as e:
             logger.error(f"Error parsing HTML with BeautifulSoup: {e}")
             return None
     
-    def extract_row_data_from_soup(self, row_soup, details_row_soup=None) -> Optional[Dict]:
+    @staticmethod
+    def extract_row_data_from_soup(row_soup, details_row_soup=None) -> Optional[Dict]:
         """
         Extract data from a table row using BeautifulSoup.
         Based on actual HTML structure: main rows have class 'result' and IDs,
@@ -320,7 +880,8 @@ class ChronicleScraper:
                 return None
             
             # Extract cells
-            cells = row_soup.find_all('td')
+            # Only the first four columns are read; limit stops the search there
+            cells = row_soup.find_all('td', limit=4)
             if len(cells) < 3:
                 return None
             
@@ -345,82 +906,7 @@ class ChronicleScraper:
                     # Find the details cell
                     details_cell = details_row_soup.find('td', class_='details')
                     if details_cell:
-                        # Extract Details section
-                        details_bold = details_cell.find('b', string=lambda text: text and 'Details' in text)
-                        if details_bold:
-                            # Get text after the Details bold tag
-                            details_text_parts = []
-                            for sibling in details_bold.next_siblings:
-                                if sibling.name == 'br':
-                                    continue
-                                if isinstance(sibling, str):
-                                    text = sibling.strip()
-                                    if text and not text.startswith('"') and not 'status:' in text.lower():
-                                        details_text_parts.append(text.strip('"'))
-                                elif sibling.name == 'b' and 'status:' in sibling.get_text().lower():
-                                    break
-                                else:
-                                    text = sibling.get_text(strip=True)
-                                    if text and not 'status:' in text.lower():
-                                        details_text_parts.append(text.strip('"'))
-                            
-                            details = ' '.join(details_text_parts).strip()
-                        
-                        # Extract State status section
-                        status_bold = details_cell.find('b', string=lambda text: text and 'status:' in text.lower())
-                        if status_bold:
-                            # Get text after the status bold tag
-                            status_text = status_bold.get_text()
-                            if ':' in status_text:
-                                state_status = status_text.split(':', 1)[1].strip()
-                            
-                            # Also check for text after the bold tag
-                            for sibling in status_bold.next_siblings:
-                                if sibling.name == 'br':
-                                    continue
-                                if isinstance(sibling, str):
-                                    text = sibling.strip().strip('"')
-                                    if text:
-                                        state_status = text
-                                        break
-                                else:
-                                    text = sibling.get_text(strip=True).strip('"')
-                                    if text:
-                                        state_status = text
-                                        break
-                        
-                        # Fallback: parse all text if structured parsing fails
-                        if not details or not state_status:
-                            full_text = details_cell.get_text(separator='\n', strip=True)
-                            lines = [line.strip() for line in full_text.split('\n') if line.strip()]
-                            
-                            in_details = False
-                            in_status = False
-                            details_parts = []
-                            status_parts = []
-                            
-                            for line in lines:
-                                if 'Details' in line and not in_details:
-                                    in_details = True
-                                    in_status = False
-                                    continue
-                                if 'status:' in line.lower():
-                                    in_details = False
-                                    in_status = True
-                                    if ':' in line:
-                                        status_parts.append(line.split(':', 1)[1].strip().strip('"'))
-                                    continue
-                                
-                                if in_details and not in_status:
-                                    details_parts.append(line.strip('"'))
-                                elif in_status:
-                                    status_parts.append(line.strip('"'))
-                            
-                            if not details and details_parts:
-                                details = ' '.join(details_parts)
-                            if not state_status and status_parts:
-                                state_status = ' '.join(status_parts)
-                                
+                        details, state_status = parse_details_text(details_cell.get_text(separator='\n', strip=True))
                 except Exception as e:
                     logger.debug(f"Could not extract details from BeautifulSoup: {e}")
             
@@ -438,30 +924,295 @@ class ChronicleScraper:
         except Exception as e:
             logger.error(f"Error extracting row data from BeautifulSoup: {e}")
             return None
+
+    @staticmethod
+    def extract_rows_from_soup(soup) -> List[Dict]:
+        """
+        Extract all data rows (and their details rows) from a parsed page.
+
+        Args:
+            soup: BeautifulSoup object for the whole page
+
+        Returns:
+            List of dictionaries with extracted data
+        """
+        rows = []
+        # A class string matches any one of a tag's class tokens, without a Python predicate per <tr>
+        result_rows = soup.find_all('tr', class_='result')
+        if not result_rows:
+            # Fallback: any tr with a numeric id and 4+ td (data row); the cheap id check runs first
+            result_rows = [tr for tr in soup.find_all('tr', id=True)
+                           if tr['id'].isdigit() and len(tr.find_all('td', limit=4)) == 4]
+        logger.info(f"Found {len(result_rows)} data rows using BeautifulSoup")
+
+        # Index details rows once per page; soup.find walks the tree on every call
+        details_by_id = {tr['id']: tr for tr in soup.find_all('tr', id=_DETAILS_ID_RE)}
+        for row_soup in result_rows:
+            try:
+                row_id = row_soup.get('id')
+                if row_id:
+                    details_row_soup = details_by_id.get(f"details_{row_id}")
+                    row_data = ChronicleScraper.extract_row_data_from_soup(row_soup, details_row_soup)
+                    if row_data:
+                        rows.append(row_data)
+            except Exception as e:
+                logger.error(f"Error processing row with BeautifulSoup: {e}")
+                continue
+        return rows
+    
+    @staticmethod
+    def extract_row_data_from_node(row_node, details_node=None) -> Optional[Dict]:
+        """
+        Extract data from a table row parsed with selectolax (same output as extract_row_data_from_soup).
+        
+        Args:
+            row_node: selectolax Node for the main row
+            details_node: selectolax Node for the details row (optional)
+            
+        Returns:
+            Dictionary with extracted data or None if extraction fails
+        """
+        try:
+            row_id = row_node.attributes.get('id') or ''
+            if not row_id:
+                return None
+            
+            cells = row_node.css('td')
+            if len(cells) < 3:
+                return None
+            
+            institution = cells[0].text(strip=True)
+            state = cells[1].text(strip=True)
+            impacts = cells[2].text(strip=True)
+            source = cells[3].text(strip=True) if len(cells) > 3 else ""
+            source_links = [link.attributes['href'] for link in cells[3].css('a[href]')] if len(cells) > 3 else []
+            
+            details = ""
+            state_status = ""
+            details_cell = details_node.css_first('td.details') if details_node else None
+            if details_cell:
+                details, state_status = parse_details_text(details_cell.text(separator='\n', strip=True))
+            
+            return {
+                "institution": institution,
+                "state": state,
+                "impacts": impacts,
+                "source": source,
+                "source_links": source_links,
+                "details": details,
+                "state_status": state_status,
+                "row_id": row_id
+            }
+            
+        except Exception as e:
+            logger.error(f"Error extracting row data from selectolax: {e}")
+            return None
+    
+    @staticmethod
+    def extract_rows_from_tree(tree) -> List[Dict]:
+        """
+        Extract all data rows (and their details rows) from a page parsed with selectolax.
+        
+        Args:
+            tree: selectolax HTMLParser for the whole page
+            
+        Returns:
+            List of dictionaries with extracted data
+        """
+        result_rows = tree.css('tr.result')
+        if not result_rows:
+            # Fallback: any tr with a numeric id and 4+ td (data row)
+            result_rows = [tr for tr in tree.css('tr[id]')
+                           if (tr.attributes.get('id') or '').isdigit() and len(tr.css('td')) >= 4]
+        logger.info(f"Found {len(result_rows)} data rows using selectolax")
+        
+        # Index details rows once per page instead of querying the tree for each row
+        details_by_id = {node.attributes['id']: node for node in tree.css('tr[id^="details_"]')}
+        
+        rows = []
+        for row_node in result_rows:
+            row_id = row_node.attributes.get('id')
+            if row_id:
+                details_node = details_by_id.get(f"details_{row_id}")
+                row_data = ChronicleScraper.extract_row_data_from_node(row_node, details_node)
+                if row_data:
+                    rows.append(row_data)
+        return rows
+    
+    @staticmethod
+    def extract_row_data_from_lxml(row_el, details_el=None) -> Optional[Dict]:
+        """
+        Extract data from a table row parsed with lxml.html (same output as extract_row_data_from_soup).
+        
+        Args:
+            row_el: lxml HtmlElement for the main row
+            details_el: lxml HtmlElement for the details row (optional)
+            
+        Returns:
+            Dictionary with extracted data or None if extraction fails
+        """
+        def text(el, separator=''):
+            # Matches BeautifulSoup's get_text(separator, strip=True)
+            return separator.join(t.strip() for t in el.itertext() if t.strip())
+        
+        try:
+            row_id = row_el.get('id') or ''
+            if not row_id:
+                return None
+            
+            cells = row_el.xpath('./td')
+            if len(cells) < 3:
+                return None
+            
+            institution = text(cells[0])
+            state = text(cells[1])
+            impacts = text(cells[2])
+            source = text(cells[3]) if len(cells) > 3 else ""
+            source_links = [str(href) for href in cells[3].xpath('.//a/@href')] if len(cells) > 3 else []
+            
+            details = ""
+            state_status = ""
+            details_cells = details_el.xpath(".//td[contains(concat(' ', normalize-space(@class), ' '), ' details ')]") \
+                if details_el is not None else []
+            if details_cells:
+                details, state_status = parse_details_text(text(details_cells[0], '\n'))
+            
+            return {
+                "institution": institution,
+                "state": state,
+                "impacts": impacts,
+                "source": source,
+                "source_links": source_links,
+                "details": details,
+                "state_status": state_status,
+                "row_id": row_id
+            }
+            
+        except Exception as e:
+            logger.error(f"Error extracting row data from lxml: {e}")
+            return None
+    
+    @staticmethod
+    def extract_rows_from_lxml(tree) -> List[Dict]:
+        """
+        Extract all data rows (and their details rows) from a page parsed with lxml.html.
+        
+        Args:
+            tree: lxml HtmlElement for the whole page
+            
+        Returns:
+            List of dictionaries with extracted data
+        """
+        result_rows = tree.xpath("//tr[contains(concat(' ', normalize-space(@class), ' '), ' result ')]")
+        if not result_rows:
+            # Fallback: any tr with a numeric id and 4+ td (data row)
+            result_rows = [tr for tr in tree.xpath('//tr[@id]')
+                           if tr.get('id').isdigit() and len(tr.xpath('./td')) >= 4]
+        logger.info(f"Found {len(result_rows)} data rows using lxml")
+        
+        # Index details rows once per page
+        details_by_id = {tr.get('id'): tr for tr in tree.xpath("//tr[starts-with(@id, 'details_')]")}
+        
+        rows = []
+        for row_el in result_rows:
+            row_id = row_el.get('id')
+            if row_id:
+                row_data = ChronicleScraper.extract_row_data_from_lxml(row_el, details_by_id.get(f"details_{row_id}"))
+                if row_data:
+                    rows.append(row_data)
+        return rows
     
-    def extract_row_data(self, row_element) -> Optional[Dict]:
+    def extract_page_rows(self, html: Optional[str] = None) -> Optional[List[Dict]]:
+        """
+        Extract all rows from the current page, reading them in-browser with one
+        execute_script call and falling back to parsing the page HTML (selectolax,
+        then lxml, then BeautifulSoup) if that fails or finds no rows.
+        
+        Args:
+            html: Page HTML already captured by the caller; parsed directly instead
+                of reading the page again
+        
+        Returns:
+            List of dictionaries with extracted data, or None if the script failed
+            and no HTML parser is available
+        """
+        if html is None:
+            try:
+                rows = self.extract_rows_with_js()
+                if rows:
+                    return rows
+            except Exception as e:
+                logger.debug(f"In-browser extraction failed, parsing page HTML instead: {e}")
+            if not HTML_PARSER_AVAILABLE:
+                return None
+            html = self.get_page_html()
+        
+        if SELECTOLAX_AVAILABLE or LXML_AVAILABLE:
+            return _parse_page_html(html)
+        soup = self.parse_html_with_beautifulsoup(html)
+        return self.extract_rows_from_soup(soup) if soup else None
+
+    @staticmethod
+    def index_rows_by_id(soup) -> Dict:
+        """Map the id of every <tr> in a parsed page to its tag, for O(1) row lookups."""
+        return {tr['id']: tr for tr in soup.find_all('tr', id=True)}
+
+    def extract_rows_with_js(self) -> List[Dict]:
+        """
+        Extract all rows on the current page with a single execute_script call, without
+        transferring or parsing the page HTML.
+        
+        Returns:
+            List of dictionaries with extracted data
+        """
+        rows = []
+        for raw in self.run_script(_BULK_EXTRACT_JS):
+            if raw['num_cells'] < 3:
+                continue
+            details, state_status = parse_details_text(raw['details_raw'])
+            rows.append({
+                "institution": raw['institution'],
+                "state": raw['state'],
+                "impacts": raw['impacts'],
+                "source": raw['source'],
+                "source_links": raw['source_links'],
+                "details": details,
+                "state_status": state_status,
+                "row_id": raw['row_id']
+            })
+        return rows
+
+    def extract_row_data(self, row_element, soup=None, rows_by_id: Optional[Dict] = None) -> Optional[Dict]:
         """
-        Extract data from a table row (wrapper that uses BeautifulSoup if available).
+        Extract data from a table row (wrapper that uses a BeautifulSoup page snapshot if given).
         
         Args:
             row_element: Selenium WebElement for the row
+            soup: BeautifulSoup object for the current page, parsed once per page by the caller
+            rows_by_id: Optional {id: tr} index of the soup's rows (see index_rows_by_id),
+                used instead of searching the soup for each row
             
         Returns:
             Dictionary with extracted data or None if extraction fails
+            
+        Raises:
+            StaleElementReferenceException: row_element was detached by a table re-render
         """
-        # Prefer BeautifulSoup if available
-        if BEAUTIFULSOUP_AVAILABLE:
+        # Prefer the parsed page snapshot if available
+        if soup is not None:
             try:
                 row_id = row_element.get_attribute('id')
                 if row_id:
-                    soup = self.parse_html_with_beautifulsoup()
-                    if soup:
-                        # Find the row in the soup
+                    if rows_by_id is not None:
+                        row_soup = rows_by_id.get(row_id)
+                        details_row_soup = rows_by_id.get(f"details_{row_id}")
+                    else:
                         row_soup = soup.find('tr', id=row_id)
-                        if row_soup:
-                            # Find corresponding details row
-                            details_row_soup = soup.find('tr', id=f"details_{row_id}")
-                            return self.extract_row_data_from_soup(row_soup, details_row_soup)
+                        details_row_soup = soup.find('tr', id=f"details_{row_id}")
+                    if row_soup:
+                        return self.extract_row_data_from_soup(row_soup, details_row_soup)
+            except StaleElementReferenceException:
+                raise
             except Exception as e:
                 logger.debug(f"BeautifulSoup extraction failed, falling back to Selenium: {e}")
         
@@ -492,38 +1243,7 @@ class ChronicleScraper:
                 details_row_id = f"details_{row_id}"
                 details_row = self.driver.find_element(By.ID, details_row_id)
                 details_cell = details_row.find_element(By.CSS_SELECTOR, "td.details")
-                details_text = details_cell.text.strip()
-                
-                lines = details_text.split('\n')
-                details_lines = []
-                status_lines = []
-                in_status = False
-                
-                for line in lines:
-                    line = line.strip()
-                    if not line or line == "Details":
-                        continue
-                    if "status:" in line.lower():
-                        in_status = True
-                        if ':' in line:
-                            state_status = line.split(':', 1)[1].strip()
-                        continue
-                    if in_status:
-                        if line and not line.startswith('"'):
-                            status_lines.append(line)
-                        elif line.startswith('"') and line.endswith('"'):
-                            state_status = line.strip('"')
-                    else:
-                        if line.startswith('"') and line.endswith('"'):
-                            details = line.strip('"')
-                        elif line:
-                            details_lines.append(line)
-                
-                if not details and details_lines:
-                    details = ' '.join(details_lines)
-                if not state_status and status_lines:
-                    state_status = ' '.join(status_lines)
-                    
+                details, state_status = parse_details_text(details_cell.text)
             except NoSuchElementException:
                 logger.debug(f"Details row not found for row {row_id}")
             except Exception as e:
@@ -540,31 +1260,40 @@ class ChronicleScraper:
                 "row_id": row_id
             }
             
+        except StaleElementReferenceException:
+            raise
         except Exception as e:
             logger.error(f"Error extracting row data: {e}")
             return None
     
-    def get_total_pages(self) -> int:
-        """Determine total number of pages."""
-        try:
-            # Look for pagination info like "Showing 1–25 of 300"
-            pagination_text = self.driver.find_element(By.CSS_SELECTOR, ".pagination-info, [class*='pagination'], [class*='count']").text
-            import re
-            match = re.search(r'of\s+(\d+)', pagination_text)
-            if match:
-                total = int(match.group(1))
-                items_per_page = 25  # Based on image description
-                return (total // items_per_page) + (1 if total % items_per_page > 0 else 0)
-        except:
-            pass
+    def get_total_pages(self, guess: bool = True) -> Optional[int]:
+        """
+        Determine total number of pages.
         
-        # Default: try to find pagination buttons
+        Args:
+            guess: Fall back to counting pagination controls (or 1) when the pagination
+                text has no total; otherwise return None in that case
+        """
         try:
-            page_buttons = self.driver.find_elements(By.CSS_SELECTOR, ".page-number, [class*='page']")
-            if page_buttons:
-                return len(page_buttons)
-        except:
-            pass
+            # Pagination info like "Showing 1–25 of 300", and the number of page controls, in one call
+            pagination_text, page_buttons = self.run_script(_PAGINATION_JS)
+        except Exception as e:
+            logger.debug(f"Could not read pagination: {e}")
+            pagination_text, page_buttons = None, 0
+        
+        match = _PAGES_RE.search(pagination_text or '')
+        if match:
+            total = int(match.group(1))
+            items_per_page = 25  # Based on image description
+            return (total // items_per_page) + (1 if total % items_per_page > 0 else 0)
+        
+        if not guess:
+            return None
+        
+        # Default: count the pagination buttons
+        if page_buttons:
+            logger.warning(f"No total in the pagination text; guessing {page_buttons} pages from pagination controls.")
+            return page_buttons
         
         logger.warning("Could not determine total pages. Will try to scrape until no more data.")
         return 1
@@ -572,77 +1301,26 @@ class ChronicleScraper:
     def go_to_next_page(self) -> bool:
         """Navigate to next page. Returns True if successful, False if no more pages."""
         try:
+            # Remember the current first row so we can tell when the next page has rendered
+            prev_first_id = self._first_row_id()
+            
             # Scroll pagination into view
             self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-            time.sleep(0.5)
-            
-            # XPath and CSS selectors for common "next" pagination patterns
-            candidates = []
-            
-            # By aria-label
-            for label in ("next", "Next", "next page", "Go to next page"):
-                try:
-                    el = self.driver.find_element(By.CSS_SELECTOR, f"button[aria-label*='{label}']")
-                    if el.is_displayed():
-                        candidates.append(el)
-                except NoSuchElementException:
-                    pass
-                try:
-                    el = self.driver.find_element(By.CSS_SELECTOR, f"a[aria-label*='{label}']")
-                    if el.is_displayed():
-                        candidates.append(el)
-                except NoSuchElementException:
-                    pass
-            
-            # By link text
-            for text in ("Next", "Next page", "»", "›"):
-                try:
-                    el = self.driver.find_element(By.LINK_TEXT, text)
-                    if el.is_displayed():
-                        candidates.append(el)
-                except NoSuchElementException:
-                    pass
-                try:
-                    el = self.driver.find_element(By.XPATH, f"//a[contains(., '{text}')]")
-                    if el.is_displayed():
-                        candidates.append(el)
-                except NoSuchElementException:
-                    pass
-            
-            # By class names
-            for selector in [
-                ".pagination-next", ".next-page", "[class*='pagination'] a[class*='next']",
-                "[class*='next']", "button.next", "a.next"
-            ]:
-                try:
-                    els = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                    for el in els:
-                        if el.is_displayed() and ("next" in (el.get_attribute("aria-label") or "").lower()
-                                                  or "next" in (el.text or "").lower()
-                                                  or el.get_attribute("class") or ""):
-                            candidates.append(el)
-                except Exception:
-                    continue
             
-            # By data attributes or role
-            try:
-                el = self.driver.find_element(By.CSS_SELECTOR, "[data-page='next'], [data-action='next']")
-                if el.is_displayed():
-                    candidates.append(el)
-            except NoSuchElementException:
-                pass
+            # Candidate "next" controls, fetched in a single lookup (filtered by text below)
+            elements = self.driver.find_elements(By.CSS_SELECTOR, ", ".join(NEXT_SELECTORS))
+            # Read visibility/label/class/text for all matches in one call instead of ~5 round-trips each
+            infos = self.driver.execute_script(_ELEMENT_INFO_JS, elements) if elements else []
+            candidates = [elements[i] for i in rank_next_candidates(infos)]
             
             for next_btn in candidates:
                 try:
-                    if not next_btn.is_enabled():
-                        continue
                     # Use JavaScript click (more reliable if element is covered or in shadow DOM)
                     self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", next_btn)
-                    time.sleep(0.3)
                     self.driver.execute_script("arguments[0].click();", next_btn)
-                    time.sleep(1.5 if self.fast else 3)
                     logger.info("Clicked next page button.")
-                    return True
+                    # A click that doesn't change the table means we're already on the last page
+                    return self._wait_for_page_change(prev_first_id)
                 except Exception as e:
                     logger.debug(f"Click failed for candidate: {e}")
                     continue
@@ -654,12 +1332,394 @@ class ChronicleScraper:
             logger.error(f"Error navigating to next page: {e}")
             return False
     
-    def scrape_all(self, expand_rows: bool = True, max_pages: Optional[int] = None) -> List[Dict]:
+    def _first_row_id(self) -> Optional[str]:
+        """Return the id of the first data row currently in the table, if any."""
+        rows = self.driver.find_elements(By.CSS_SELECTOR, "tr.result")
+        return rows[0].get_attribute('id') if rows else None
+    
+    def _wait_for_page_change(self, prev_first_id: Optional[str]) -> bool:
+        """Wait until the table shows a different first row than before navigation. Returns False on timeout."""
+        wait = WebDriverWait(self.driver, self.wait_time, poll_frequency=WAIT_POLL,
+                             ignored_exceptions=(StaleElementReferenceException,))
+        try:
+            if prev_first_id is None:
+                wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, "tr.result")))
+            else:
+                wait.until(lambda d: self._first_row_id() not in (None, prev_first_id))
+            return True
+        except TimeoutException:
+            logger.warning(f"Table did not change within {self.wait_time}s after clicking next page.")
+            return False
+
+    def get_session_cookies(self) -> Dict[str, str]:
+        """Export the browser's cookies (e.g. after login) for reuse by aiohttp."""
+        return {cookie['name']: cookie['value'] for cookie in self.driver.get_cookies()}
+
+    async def __aenter__(self):
+        """
+        Open the HTTP session used for page_url fetches, with the browser's current cookies
+        (Selenium engine; Playwright's sync API can't be called from inside an event loop).
+        """
+        return await self._open_session(self.get_session_cookies())
+
+    async def _open_session(self, cookies: Dict[str, str]):
+        """
+        Open the HTTP session used for page_url fetches. One session (and its keep-alive
+        connection pool) is shared by every fetch_page call, so the TCP+TLS handshake is
+        paid once per connection rather than once per page.
+        """
+        connector = aiohttp.TCPConnector(limit_per_host=self.concurrency, keepalive_timeout=60)
+        self.session = aiohttp.ClientSession(connector=connector, cookies=cookies,
+                                             headers={'User-Agent': USER_AGENT,
+                                                      'Accept-Encoding': 'gzip, deflate'})
+        self._fetch_semaphore = asyncio.Semaphore(self.concurrency)
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        """Close the HTTP session (the browser stays open until close())."""
+        if self.session:
+            await self.session.close()
+            self.session = None
+
+    async def fetch_page(self, page_num: int) -> str:
+        """
+        Fetch the raw HTML for one table page over HTTP (while the session is open, e.g. inside "async with scraper:").
+        Retries connection errors and rate-limit/server errors with exponential backoff,
+        honoring a numeric Retry-After header when the server sends one.
+
+        Args:
+            page_num: 1-based page number substituted into page_url
+
+        Returns:
+            Page HTML
+        """
+        url = self.page_url.format(page=page_num)
+        error = ""
+        async with self._fetch_semaphore:
+            for attempt in range(self.max_retries):
+                delay = 2 ** attempt + random.random()
+                try:
+                    async with self.session.get(url) as response:
+                        if response.status not in RETRY_STATUSES:
+                            response.raise_for_status()
+                            # aiohttp decodes with the declared charset (UTF-8 if it's missing or
+                            # unknown); a stray invalid byte shouldn't cost the whole page
+                            return await response.text(errors='replace')
+                        error = f"HTTP {response.status}"
+                        retry_after = response.headers.get('Retry-After', '')
+                        if retry_after.isdigit():
+                            delay = int(retry_after)
+                except aiohttp.ClientResponseError:
+                    raise
+                except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                    error = str(e) or type(e).__name__
+                
+                if attempt + 1 < self.max_retries:
+                    logger.warning(f"Page {page_num}: {error}; retrying in {delay:.1f}s "
+                                   f"(attempt {attempt + 1}/{self.max_retries})")
+                    await asyncio.sleep(delay)
+        raise aiohttp.ClientError(f"giving up after {self.max_retries} attempts ({error})")
+
+    async def _scrape_pages_async(self, page_numbers: List[int], pool: ProcessPoolExecutor,
+                                  stream: Optional[RowStream] = None) -> List[List[Dict]]:
+        """
+        Fetch pages concurrently over the scraper's open ClientSession and parse them in the
+        process pool, so parsing runs on all cores without blocking the event loop.
+        Each page's rows are handed to stream (if given) as soon as that page is parsed.
+
+        Returns:
+            One list of row dictionaries per requested page (empty if the page failed)
+        """
+        loop = asyncio.get_running_loop()
+
+        async def fetch_and_parse(page_num: int) -> List[Dict]:
+            try:
+                html = await self.fetch_page(page_num)
+                rows = await loop.run_in_executor(pool, _parse_page_html, html)
+                logger.info(f"Page {page_num}: extracted {len(rows)} records")
+            except Exception as e:
+                logger.error(f"Error fetching page {page_num}: {e}")
+                rows = []
+            if stream:
+                stream.write_page(page_num, rows)
+            return rows
+
+        return await asyncio.gather(*[fetch_and_parse(n) for n in page_numbers])
+
+    def _scrape_pages_over_http(self, total_pages: Optional[int], max_pages: Optional[int] = None,
+                                stream: Optional[RowStream] = None) -> List[Dict]:
+        """
+        Fetch and parse pages from page_url over HTTP, with one parse pool, event loop and
+        ClientSession for the whole scrape. The pool is spawned, not forked, for the same
+        reason as the browser workers: a forked child would inherit (and could quit) this
+        process's browsers.
+        """
+        # Read the cookies before any async code runs: Playwright's sync API can't be called inside a loop
+        cookies = self.get_session_cookies()
+        # The loop runs in its own thread, since Playwright's sync API keeps one running in this thread
+        loop = asyncio.new_event_loop()
+        loop_thread = threading.Thread(target=loop.run_forever, daemon=True)
+        loop_thread.start()
+        
+        def run(coro):
+            return asyncio.run_coroutine_threadsafe(coro, loop).result()
+        
+        workers = max(1, min(os.cpu_count() or 1, self.concurrency))
+        try:
+            with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('spawn')) as pool:
+                run(self._open_session(cookies))
+                try:
+                    return self._scrape_page_url(
+                        lambda page_numbers: run(self._scrape_pages_async(page_numbers, pool, stream)),
+                        self.concurrency, total_pages, max_pages)
+                finally:
+                    run(self.__aexit__(None, None, None))
+        finally:
+            loop.call_soon_threadsafe(loop.stop)
+            loop_thread.join()
+            loop.close()
+
+    def _scrape_pages_in_browsers(self, page_numbers: List[int], pool: ProcessPoolExecutor,
+                                  stream: Optional[RowStream] = None) -> List[List[Dict]]:
+        """
+        Render pages in the browser worker pool, one page per task, so a slow page only
+        holds up its own worker. Rows are handed to stream (if given) as each page finishes.
+
+        Returns:
+            One list of row dictionaries per requested page (empty if the page failed)
+        """
+        futures = {pool.submit(_scrape_page_worker, page_num): page_num for page_num in page_numbers}
+        results = {}
+        for future in as_completed(futures):
+            page_num = futures[future]
+            try:
+                rows = future.result()
+                logger.info(f"Page {page_num}: extracted {len(rows)} records")
+            except Exception as e:
+                logger.error(f"Error scraping page {page_num} in browser worker: {e}")
+                rows = []
+            if stream:
+                stream.write_page(page_num, rows)
+            results[page_num] = rows
+        return [results[page_num] for page_num in page_numbers]
+
+    def _scrape_pages_with_workers(self, total_pages: Optional[int], max_pages: Optional[int] = None,
+                                   expand_rows: bool = True, stream: Optional[RowStream] = None) -> List[Dict]:
+        """
+        Render pages from page_url in parallel headless browsers, one per worker process
+        (WebDriver is not thread-safe). The pool lives for the whole scrape: each worker
+        launches one Chrome and copies this browser's login cookies into it once, then
+        renders pages until the scrape is done.
+        """
+        # Hand workers the already-resolved driver path so they don't each race ChromeDriverManager
+        initargs = (self.page_url, self.driver.get_cookies(), expand_rows, self.fast, self.block_resources,
+                    get_chromedriver_path(), self.wait_time)
+        # spawn, not fork: a forked child would inherit (and could quit) this process's pooled browsers
+        with ProcessPoolExecutor(max_workers=self.workers, mp_context=multiprocessing.get_context('spawn'),
+                                 initializer=_init_browser_worker, initargs=initargs) as pool:
+            return self._scrape_page_url(
+                lambda page_numbers: self._scrape_pages_in_browsers(page_numbers, pool, stream),
+                self.workers, total_pages, max_pages)
+
+    def _open_tab(self, url: str) -> Optional[str]:
+        """
+        Start loading url in a new tab without waiting for it; returns the tab's handle
+        (and leaves it as the current window). CDP resource blocking only applies to the
+        tab it was sent to, so the tab opens blank and is blocked before it navigates.
+        """
+        before = set(self.driver.window_handles)
+        self.driver.execute_script("window.open('about:blank', '_blank');")
+        opened = set(self.driver.window_handles) - before
+        if not opened:
+            return None
+        handle = opened.pop()
+        self.driver.switch_to.window(handle)
+        if self.block_resources:
+            try:
+                self.driver.execute_cdp_cmd('Network.enable', {})
+                self.driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': BLOCKED_URL_PATTERNS})
+            except Exception as e:
+                logger.debug(f"Could not block resources via CDP: {e}")
+        # Unlike driver.get, navigating from a script doesn't wait for the page to load
+        self.driver.execute_script("window.location.href = arguments[0];", url)
+        return handle
+
+    def _scrape_pages_in_tabs(self, page_numbers: List[int], expand_rows: bool = True,
+                              stream: Optional[RowStream] = None) -> List[List[Dict]]:
+        """
+        Load pages concurrently in up to self.tabs tabs of this browser. Each batch of pages
+        is opened with window.open (which doesn't block like driver.get), then each tab is
+        extracted in page order while the rest keep loading, and closed.
+
+        Returns:
+            One list of row dictionaries per requested page (empty if the page failed)
+        """
+        main_handle = self.driver.current_window_handle
+        pages = []
+        for start in range(0, len(page_numbers), self.tabs):
+            batch = page_numbers[start:start + self.tabs]
+            handles = []
+            for page_num in batch:
+                try:
+                    handles.append(self._open_tab(self.page_url.format(page=page_num)))
+                except Exception as e:
+                    logger.debug(f"Error opening tab for page {page_num}: {e}")
+                    handles.append(None)
+            self.driver.switch_to.window(main_handle)
+            for page_num, handle in zip(batch, handles):
+                rows = []
+                if handle is None:
+                    logger.error(f"Could not open a tab for page {page_num}")
+                else:
+                    switched = False
+                    try:
+                        self.driver.switch_to.window(handle)
+                        switched = True
+                        WebDriverWait(self.driver, self.wait_time, poll_frequency=WAIT_POLL).until(
+                            EC.presence_of_element_located((By.CSS_SELECTOR, "tr.result")))
+                        if expand_rows:
+                            self.expand_all_rows()
+                        rows = self.extract_page_rows() or []
+                        logger.info(f"Page {page_num}: extracted {len(rows)} records")
+                    except Exception as e:
+                        logger.error(f"Error scraping page {page_num} in tab: {e}")
+                        rows = []
+                    finally:
+                        # Only close the tab once we're on it; otherwise this would close the main window
+                        if switched:
+                            self.driver.close()
+                        self.driver.switch_to.window(main_handle)
+                if stream:
+                    stream.write_page(page_num, rows)
+                pages.append(rows)
+        return pages
+
+    @staticmethod
+    def _log_page_count(total_pages: Optional[int], max_pages: Optional[int] = None):
+        """Log how many pages scrape_all will visit (total_pages is None when unknown)."""
+        limit = min(max_pages, PAGE_LIMIT) if max_pages else PAGE_LIMIT
+        if total_pages is None:
+            logger.warning(f"Could not read the page count from the pagination text. "
+                           f"Requesting pages until one comes back empty (at most {limit}).")
+        else:
+            logger.info(f"Found {total_pages} pages to scrape (scraping {min(total_pages, limit)}). "
+                        f"Use --fast and/or --max-pages 1 to speed up.")
+    
+    def _scrape_page_url(self, fetch_pages, batch_size: int, total_pages: Optional[int],
+                         max_pages: Optional[int] = None) -> List[Dict]:
+        """
+        Scrape pages straight from page_url, capped at PAGE_LIMIT (and max_pages) like
+        browser pagination.
+        
+        Args:
+            fetch_pages: Callable taking a list of page numbers and returning one list of rows
+                per page (empty if the page failed or is past the last page)
+            batch_size: Pages to request at a time when the page count is unknown
+            total_pages: Page count read from the pagination text, or None to request
+                batches of pages until one comes back empty
+            max_pages: Stop after this many pages
+            
+        Returns:
+            List of dictionaries containing scraped data
+        """
+        limit = min(max_pages, PAGE_LIMIT) if max_pages else PAGE_LIMIT
+        all_data = []
+        if total_pages is not None:
+            for rows in fetch_pages(list(range(1, min(total_pages, limit) + 1))):
+                all_data.extend(rows)
+        else:
+            page_num = 1
+            while page_num <= limit:
+                pages = fetch_pages(list(range(page_num, min(page_num + batch_size, limit + 1))))
+                for rows in pages:
+                    all_data.extend(rows)
+                if not all(pages):
+                    logger.info("Reached an empty page. No more pages to scrape")
+                    break
+                page_num += len(pages)
+            else:
+                if limit == PAGE_LIMIT:
+                    logger.warning(f"Reached page limit ({PAGE_LIMIT}). Stopping.")
+        
+        logger.info(f"Scraping complete. Extracted {len(all_data)} records.")
+        return all_data
+    
+    def _scrape_current_page(self, page_num: int, expand_rows: bool = True) -> List[Dict]:
+        """
+        Extract the rows of the table page the browser is showing: the whole page at once
+        (in-browser, else with an HTML parser), falling back to row-by-row extraction.
+        """
+        page_html = None  # read from the browser at most once per page, after expansion
+        
+        # Extract the whole page at once (in-browser, else with an HTML parser)
+        if expand_rows:
+            try:
+                wait = WebDriverWait(self.driver, self.wait_time)
+                wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, "tbody, table")))
+                
+                num_rows = len(self.driver.find_elements(By.CSS_SELECTOR, "tr.result"))
+                logger.info(f"Expanding {num_rows} rows on page {page_num}...")
+                self.expand_all_rows()
+                
+                # Now extract entire page, in-browser if possible, else from its HTML
+                rows = None
+                try:
+                    rows = self.extract_rows_with_js() or None
+                except Exception as e:
+                    logger.debug(f"In-browser extraction failed, parsing page HTML instead: {e}")
+                if rows is None and HTML_PARSER_AVAILABLE:
+                    page_html = self.get_page_html()
+                    rows = self.extract_page_rows(page_html)
+                if rows is not None:
+                    return rows
+            except Exception as e:
+                logger.debug(f"Page extraction failed, falling back to per-row extraction: {e}")
+        
+        # Fallback to Selenium-based extraction (parse page once per page, not per row)
+        rows = []
+        try:
+            wait = WebDriverWait(self.driver, self.wait_time)
+            wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, "tbody, table")))
+            
+            if expand_rows and page_html is None:
+                self.expand_all_rows()
+            
+            # Query the rows once, after expanding (which can re-render the table)
+            data_rows = self.driver.find_elements(By.CSS_SELECTOR, "tr.result")
+            logger.info(f"Found {len(data_rows)} data rows on page {page_num}")
+            
+            # Parse page once with BeautifulSoup (if available) and reuse that snapshot for every row
+            soup = self.parse_html_with_beautifulsoup(page_html)
+            if soup is None:
+                # No HTML parser: read every row in one script call
+                rows.extend(self.extract_rows_with_js())
+            else:
+                rows_by_id = self.index_rows_by_id(soup)
+                for idx in range(len(data_rows)):
+                    try:
+                        try:
+                            row_data = self.extract_row_data(data_rows[idx], soup, rows_by_id)
+                        except StaleElementReferenceException:
+                            # The table re-rendered: refresh the row references once and retry
+                            data_rows = self.driver.find_elements(By.CSS_SELECTOR, "tr.result")
+                            row_data = self.extract_row_data(data_rows[idx], soup, rows_by_id)
+                        if row_data:
+                            rows.append(row_data)
+                    except Exception as e:
+                        logger.error(f"Error processing row {idx + 1}: {e}")
+        except Exception as e:
+            logger.error(f"Error scraping page {page_num}: {e}")
+        return rows
+    
+    def scrape_all(self, expand_rows: bool = True, max_pages: Optional[int] = None,
+                   stream: Optional[RowStream] = None) -> List[Dict]:
         """
         Scrape all data from all pages.
         
         Args:
             expand_rows: Whether to expand rows to get full details
+            max_pages: Stop after this many pages
+            stream: Optional RowStream that each page's rows are written to as soon as they are extracted
             
         Returns:
             List of dictionaries containing scraped data
@@ -668,140 +1728,38 @@ class ChronicleScraper:
         
         # Wait for table to load
         self.wait_for_table()
-        time.sleep(1 if self.fast else 2)
-        
-        # Determine total pages
-        total_pages = self.get_total_pages()
-        pages_to_scrape = min(total_pages, max_pages) if max_pages else total_pages
-        logger.info(f"Found {total_pages} pages to scrape (scraping {pages_to_scrape}). Use --fast and/or --max-pages 1 to speed up.")
+        self._wait_for_load(1 if self.fast else 2)
         
+        # Determine total pages (page_url mode requests pages blindly, so it doesn't guess)
+        total_pages = self.get_total_pages(guess=not self.page_url)
+        self._log_page_count(total_pages, max_pages)
+
+        # Go straight to each page when the table's page endpoint is known: in parallel browser
+        # processes, in tabs of this browser, or over HTTP
+        if self.page_url and self.workers > 1:
+            logger.info(f"Rendering pages in {self.workers} browser processes from {self.page_url}")
+            return self._scrape_pages_with_workers(total_pages, max_pages, expand_rows, stream)
+        if self.page_url and self.tabs > 1:
+            logger.info(f"Loading pages {self.tabs} tabs at a time from {self.page_url}")
+            return self._scrape_page_url(
+                lambda page_numbers: self._scrape_pages_in_tabs(page_numbers, expand_rows, stream),
+                self.tabs, total_pages, max_pages)
+        if self.page_url and HTML_PARSER_AVAILABLE:
+            if AIOHTTP_AVAILABLE:
+                logger.info(f"Fetching pages concurrently from {self.page_url}")
+                return self._scrape_pages_over_http(total_pages, max_pages, stream)
+            logger.warning("page_url set but aiohttp not available. Falling back to browser pagination.")
+
         page_num = 1
         
         while True:
             logger.info(f"Scraping page {page_num}...")
+            rows = self._scrape_current_page(page_num, expand_rows)
+            all_data.extend(rows)
+            logger.info(f"Page {page_num}: extracted {len(all_data)} records total so far")
             
-            page_done = False
-            # Parse with BeautifulSoup if available (more efficient)
-            if BEAUTIFULSOUP_AVAILABLE and expand_rows:
-                try:
-                    wait = WebDriverWait(self.driver, self.wait_time)
-                    wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, "tbody, table")))
-                    
-                    # Expand all rows: re-query by index each time to avoid stale element references
-                    data_rows = self.driver.find_elements(By.CSS_SELECTOR, "tr.result")
-                    num_rows = len(data_rows)
-                    logger.info(f"Expanding {num_rows} rows on page {page_num}...")
-                    
-                    delay_expand = 0.1 if self.fast else 0.3
-                    delay_after = 0.5 if self.fast else 2
-                    for i in range(num_rows):
-                        try:
-                            rows = self.driver.find_elements(By.CSS_SELECTOR, "tr.result")
-                            if i >= len(rows):
-                                break
-                            self.expand_row(rows[i])
-                            time.sleep(delay_expand)
-                        except Exception as e:
-                            logger.debug(f"Expand row {i}: {e}")
-                            continue
-                    
-                    time.sleep(delay_after)  # Let details rows render
-                    
-                    # Now parse entire page with BeautifulSoup
-                    soup = self.parse_html_with_beautifulsoup()
-                    if soup:
-                        result_rows = soup.find_all('tr', class_=lambda x: x and 'result' in (x if isinstance(x, str) else (x or [])))
-                        if not result_rows:
-                            # Fallback: any tr with id and 4+ td (data row)
-                            result_rows = [tr for tr in soup.find_all('tr', id=True)
-                                           if len(tr.find_all('td')) >= 4 and tr.get('id', '').isdigit()]
-                        logger.info(f"Found {len(result_rows)} data rows using BeautifulSoup")
-                        
-                        for row_soup in result_rows:
-                            try:
-                                row_id = row_soup.get('id')
-                                if row_id:
-                                    details_row_soup = soup.find('tr', id=f"details_{row_id}")
-                                    row_data = self.extract_row_data_from_soup(row_soup, details_row_soup)
-                                    if row_data:
-                                        all_data.append(row_data)
-                            except Exception as e:
-                                logger.error(f"Error processing row with BeautifulSoup: {e}")
-                                continue
-                        
-                        logger.info(f"Page {page_num}: extracted {len(all_data)} records total so far")
-                        page_done = True
-                    else:
-                        page_done = False
-                except Exception as e:
-                    logger.debug(f"BeautifulSoup parsing failed, falling back to Selenium: {e}")
-                    page_done = False
-            
-            if not page_done:
-                # Fallback to Selenium-based extraction (parse page once per page, not per row)
-                try:
-                    wait = WebDriverWait(self.driver, self.wait_time)
-                    wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, "tbody, table")))
-                    
-                    data_rows = self.driver.find_elements(By.CSS_SELECTOR, "tr.result")
-                    logger.info(f"Found {len(data_rows)} data rows on page {page_num}")
-                    
-                    # Expand all rows: re-query by index to avoid stale elements
-                    delay_expand = 0.1 if self.fast else 0.3
-                    if expand_rows:
-                        num_rows = len(data_rows)
-                        for i in range(num_rows):
-                            try:
-                                rows = self.driver.find_elements(By.CSS_SELECTOR, "tr.result")
-                                if i >= len(rows):
-                                    break
-                                self.expand_row(rows[i])
-                                time.sleep(delay_expand)
-                            except Exception:
-                                continue
-                        time.sleep(0.8 if self.fast else 1.5)  # Let details render
-                    
-                    # Parse page once with BeautifulSoup (if available), then extract all rows from that
-                    if BEAUTIFULSOUP_AVAILABLE:
-                        soup = self.parse_html_with_beautifulsoup()
-                        if soup:
-                            for row in data_rows:
-                                try:
-                                    row_id = row.get_attribute('id')
-                                    if row_id:
-                                        row_soup = soup.find('tr', id=row_id)
-                                        details_row_soup = soup.find('tr', id=f"details_{row_id}")
-                                        if row_soup:
-                                            row_data = self.extract_row_data_from_soup(row_soup, details_row_soup)
-                                            if row_data:
-                                                all_data.append(row_data)
-                                except Exception as e:
-                                    logger.error(f"Error processing row: {e}")
-                                    continue
-                            logger.info(f"Page {page_num}: extracted {len(all_data)} records total so far")
-                        else:
-                            # Fallback: extract per row (slower)
-                            for idx, row in enumerate(data_rows, 1):
-                                try:
-                                    row_data = self.extract_row_data(row)
-                                    if row_data:
-                                        all_data.append(row_data)
-                                    time.sleep(0.1 if self.fast else 0.3)
-                                except Exception as e:
-                                    logger.error(f"Error processing row {idx}: {e}")
-                    else:
-                        for idx, row in enumerate(data_rows, 1):
-                            try:
-                                row_data = self.extract_row_data(row)
-                                if row_data:
-                                    all_data.append(row_data)
-                                time.sleep(0.1 if self.fast else 0.3)
-                            except Exception as e:
-                                logger.error(f"Error processing row {idx}: {e}")
-                    
-                    logger.info(f"Page {page_num}: extracted {len(all_data)} records total so far")
-                except Exception as e:
-                    logger.error(f"Error scraping page {page_num}: {e}")
+            if stream:
+                stream.write_rows(rows)
             
             # Try to go to next page
             if not self.go_to_next_page():
@@ -815,8 +1773,8 @@ class ChronicleScraper:
                 logger.info(f"Reached max pages ({max_pages}). Stopping.")
                 break
             
-            if page_num > 20:
-                logger.warning("Reached page limit (20). Stopping.")
+            if page_num > PAGE_LIMIT:
+                logger.warning(f"Reached page limit ({PAGE_LIMIT}). Stopping.")
                 break
         
         logger.info(f"Scraping complete. Extracted {len(all_data)} records.")
@@ -831,24 +1789,31 @@ class ChronicleScraper:
             logger.warning("No data to save")
             return
         
-        fieldnames = ["institution", "state", "impacts", "source", "source_links", "details", "state_status", "row_id"]
-        
-        with open(filename, 'w', newline='', encoding='utf-8') as csvfile:
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-            writer.writeheader()
-            
-            for row in data:
-                # Convert source_links list to string
-                row_copy = row.copy()
-                row_copy['source_links'] = '; '.join(row_copy.get('source_links', []))
-                writer.writerow(row_copy)
+        if PANDAS_AVAILABLE:
+            # Join every row's source_links in one column-wide pass, then let pandas write the file
+            df = pd.DataFrame(data, columns=CSV_FIELDNAMES)
+            df['source_links'] = df['source_links'].map('; '.join, na_action='ignore')
+            df.to_csv(filename, index=False, encoding='utf-8', lineterminator='\r\n')
+        else:
+            with open(filename, 'w', newline='', encoding='utf-8') as csvfile:
+                writer = csv.DictWriter(csvfile, fieldnames=CSV_FIELDNAMES)
+                writer.writeheader()
+                
+                for row in data:
+                    # Convert source_links list to string
+                    writer.writerow(to_csv_row(row))
         
         logger.info(f"Data saved to {filename}")
     
     def save_to_json(self, data: List[Dict], filename: str = "chronicle_dei_data.json"):
         """Save scraped data to JSON file."""
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        if ORJSON_AVAILABLE:
+            # orjson serializes straight to UTF-8 bytes in C; same layout as json.dump(indent=2)
+            with open(filename, 'wb') as f:
+                f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+        else:
+            with open(filename, 'w', encoding='utf-8') as f:
+                json.dump(data, f, indent=2, ensure_ascii=False)
         
         logger.info(f"Data saved to {filename}")
     
@@ -876,14 +1841,14 @@ class ChronicleScraper:
         column_order = ["institution", "state", "impacts", "source", "details", "state_status", "source_links", "row_id"]
         # Only include columns that exist
         column_order = [col for col in column_order if col in df.columns]
-        df = df[column_order]
+        df = df[column_order].copy()
         
         # Clean up data
         if 'source_links' in df.columns:
-            # Convert list to string if needed
-            df['source_links'] = df['source_links'].apply(
-                lambda x: '; '.join(x) if isinstance(x, list) else str(x) if x else ''
-            )
+            # Convert lists to strings column-wide; anything else becomes a (possibly empty) string
+            is_list = df['source_links'].map(type) == list
+            df.loc[is_list, 'source_links'] = df.loc[is_list, 'source_links'].map('; '.join)
+            df.loc[~is_list, 'source_links'] = df.loc[~is_list, 'source_links'].fillna('').astype(str)
         
         return df
     
@@ -907,11 +1872,11 @@ class ChronicleScraper:
             table_data = []
             for row in display_data:
                 table_data.append([
-                    row.get('institution', '')[:40] + '...' if len(row.get('institution', '')) > 40 else row.get('institution', ''),
+                    _trunc(row.get('institution', ''), 40),
                     row.get('state', ''),
-                    row.get('impacts', '')[:30] + '...' if len(row.get('impacts', '')) > 30 else row.get('impacts', ''),
-                    row.get('source', '')[:30] + '...' if len(row.get('source', '')) > 30 else row.get('source', ''),
-                    row.get('details', '')[:50] + '...' if len(row.get('details', '')) > 50 else row.get('details', ''),
+                    _trunc(row.get('impacts', ''), 30),
+                    _trunc(row.get('source', ''), 30),
+                    _trunc(row.get('details', ''), 50),
                 ])
             
             headers = ["Institution", "State", "Impacts", "Source", "Details"]
@@ -967,9 +1932,11 @@ class ChronicleScraper:
             with pd.ExcelWriter(filename, engine='openpyxl') as writer:
                 df.to_excel(writer, sheet_name='DEI Data', index=False)
                 worksheet = writer.sheets['DEI Data']
+                # Widths are capped at 50, so the first 1000 rows are a good enough sample
+                sample = df.head(1000).astype(str)
                 for idx, col in enumerate(df.columns, 1):
                     max_length = max(
-                        df[col].astype(str).map(len).max(),
+                        sample[col].str.len().max(),
                         len(str(col))
                     )
                     adjusted_width = min(max_length + 2, 50)
@@ -981,31 +1948,285 @@ class ChronicleScraper:
             logger.error(f"Error saving to Excel: {e}")
     
     def close(self):
-        """Close the browser."""
+        """Return the browser to the pool (pooled browsers are quit when the process exits)."""
         if self.driver:
-            self.driver.quit()
+            BROWSER_POOL.release(self.driver)
+            self.driver = None
+            logger.info("Browser released")
+    
+    def __del__(self):
+        # A scraper dropped without close() may be mid-page; quit its browser rather than reuse it
+        driver = getattr(self, 'driver', None)
+        if driver is not None:
+            try:
+                BROWSER_POOL.retire(driver)
+            except Exception:
+                pass
+
+
+class ChronicleScraperPW(ChronicleScraper):
+    """
+    ChronicleScraper driven by Playwright instead of Selenium.
+    Playwright talks to Chromium over one persistent websocket, so each DOM query or script
+    call is much cheaper than a WebDriver HTTP round-trip. Extraction, parsing and output
+    are inherited; only the browser-facing methods are replaced. Parallel --workers/--tabs
+    rendering is Selenium-only.
+    """
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        if self.workers > 1 or self.tabs > 1:
+            logger.warning("--workers/--tabs are only supported with the Selenium engine. Ignoring.")
+            self.workers = self.tabs = 1
+    
+    def setup_driver(self, headless: bool):
+        """Launch Chromium through Playwright (one browser per scraper, not pooled)."""
+        if not PLAYWRIGHT_AVAILABLE:
+            raise RuntimeError("playwright not available. Install with: pip install playwright && playwright install chromium")
+        
+        # Same Chrome flags as the Selenium browsers; headless mode and user agent are set through Playwright
+        args = [arg for arg in build_chrome_options(headless, self.block_resources).arguments
+                if not arg.startswith(('--headless', 'user-agent'))]
+        self._playwright = sync_playwright().start()
+        try:
+            self._browser = self._playwright.chromium.launch(headless=headless, args=args)
+            self._context = self._browser.new_context(user_agent=USER_AGENT, viewport={'width': 1920, 'height': 1080})
+            self.page = self._context.new_page()
+            self.page.set_default_timeout(self.wait_time * 1000)
+            if self.block_resources:
+                # Blocked in the browser via CDP, like the Selenium pool, rather than routing every request through Python
+                try:
+                    cdp = self._context.new_cdp_session(self.page)
+                    cdp.send('Network.enable')
+                    cdp.send('Network.setBlockedURLs', {'urls': BLOCKED_URL_PATTERNS})
+                except Exception as e:
+                    logger.debug(f"Could not block resources via CDP: {e}")
+        except Exception as e:
+            self._playwright.stop()
+            self._playwright = None
+            logger.error(f"Failed to launch Playwright Chromium: {e}")
+            raise
+        logger.info("Playwright Chromium initialized successfully")
+    
+    def open_table(self):
+        """Navigate to the page with the tracking table."""
+        logger.info("Navigating to Chronicle website...")
+        self.page.goto(self.url, wait_until='domcontentloaded')
+    
+    def run_script(self, script: str, *args):
+        """Run a JavaScript function body (which may use return and arguments[i]) in the page."""
+        return self.page.evaluate("args => (function() {" + script + "}).apply(null, args)", list(args))
+    
+    def _find_first(self, css: str, xpath_fallback: Optional[str] = None):
+        """
+        Return the first element matching a (comma-separated) CSS selector list, or None.
+        The text-based XPath fallback is only evaluated when the CSS lookup finds nothing.
+        """
+        element = self.page.query_selector(css)
+        if element is None and xpath_fallback:
+            element = self.page.query_selector(f"xpath={xpath_fallback}")
+        return element
+    
+    def _wait_for_element(self, css: str):
+        """Wait up to wait_time for an element matching css to be in the page; returns it, or None on timeout."""
+        try:
+            return self.page.wait_for_selector(css, state='attached')
+        except PlaywrightTimeoutError:
+            return None
+    
+    def _fill(self, field, text: str):
+        """Replace the contents of an input field with text."""
+        field.fill(text)
+    
+    def _wait_for_load(self, seconds: float):
+        """Wait for the page's network to go idle (at once if it already is) instead of sleeping."""
+        try:
+            self.page.wait_for_load_state('networkidle')
+        except PlaywrightTimeoutError:
+            logger.debug("Page network did not go idle")
+    
+    def expand_all_rows(self):
+        """Expand every result row on the current page with one in-page click pass, then wait once for them to open."""
+        clicked = self.run_script(_EXPAND_ALL_JS)
+        try:
+            self.page.wait_for_function("() => (function() {" + _COLLAPSED_ROW_IDS_JS + "})().length === 0",
+                                        polling=WAIT_POLL * 1000)
+            logger.debug(f"Batch-expanded {clicked} rows")
+        except PlaywrightTimeoutError:
+            logger.debug("Some rows still look collapsed after expanding")
+    
+    def get_page_html(self) -> str:
+        """Get the current page HTML."""
+        return self.page.content()
+    
+    def go_to_next_page(self) -> bool:
+        """Navigate to next page. Returns True if successful, False if no more pages."""
+        try:
+            prev_first_id = self._first_row_id()
+            self.page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
+            
+            elements = self.page.query_selector_all(", ".join(NEXT_SELECTORS))
+            infos = self.run_script(_ELEMENT_INFO_JS, elements) if elements else []
+            for i in rank_next_candidates(infos):
+                try:
+                    elements[i].evaluate("el => { el.scrollIntoView({block: 'center'}); el.click(); }")
+                    logger.info("Clicked next page button.")
+                    # A click that doesn't change the table means we're already on the last page
+                    return self._wait_for_page_change(prev_first_id)
+                except Exception as e:
+                    logger.debug(f"Click failed for candidate: {e}")
+                    continue
+            
+            logger.warning("Could not find or click next page button.")
+            return False
+            
+        except Exception as e:
+            logger.error(f"Error navigating to next page: {e}")
+            return False
+    
+    def _first_row_id(self) -> Optional[str]:
+        """Return the id of the first data row currently in the table, if any."""
+        row = self.page.query_selector("tr.result")
+        return row.get_attribute('id') if row else None
+    
+    def _wait_for_page_change(self, prev_first_id: Optional[str]) -> bool:
+        """Wait until the table shows a different first row than before navigation. Returns False on timeout."""
+        try:
+            self.page.wait_for_function(
+                "prev => { const row = document.querySelector('tr.result'); return row !== null && row.id !== prev; }",
+                arg=prev_first_id, polling=WAIT_POLL * 1000)
+            return True
+        except PlaywrightTimeoutError:
+            logger.warning(f"Table did not change within {self.wait_time}s after clicking next page.")
+            return False
+    
+    def get_session_cookies(self) -> Dict[str, str]:
+        """Export the browser's cookies (e.g. after login) for reuse by aiohttp."""
+        return {cookie['name']: cookie['value'] for cookie in self._context.cookies()}
+    
+    def _scrape_current_page(self, page_num: int, expand_rows: bool = True) -> List[Dict]:
+        """Extract the rows of the table page the browser is showing."""
+        try:
+            if expand_rows:
+                self.expand_all_rows()
+            return self.extract_page_rows() or []
+        except Exception as e:
+            logger.error(f"Error scraping page {page_num}: {e}")
+            return []
+    
+    def close(self):
+        """Close the Playwright browser."""
+        if getattr(self, '_playwright', None):
+            try:
+                self._browser.close()
+            except Exception as e:
+                logger.debug(f"Error closing Playwright browser: {e}")
+            self._playwright.stop()
+            self._playwright = None
             logger.info("Browser closed")
 
 
+def _parse_page_html(html: str) -> List[Dict]:
+    """Parse one page of fetched HTML into row dictionaries (top-level so process pools can pickle it)."""
+    if SELECTOLAX_AVAILABLE:
+        return ChronicleScraper.extract_rows_from_tree(HTMLParser(html))
+    if LXML_AVAILABLE:
+        return ChronicleScraper.extract_rows_from_lxml(lxml.html.fromstring(html))
+    return ChronicleScraper.extract_rows_from_soup(BeautifulSoup(html, BS4_PARSER, parse_only=SoupStrainer('tr')))
+
+
+# This worker process's browser and settings, set up once by _init_browser_worker
+_worker_scraper = None
+_worker_expand_rows = True
+
+
+def _init_browser_worker(page_url: str, cookies: List[Dict], expand_rows: bool, fast: bool,
+                         block_resources: bool, driver_path: str, wait_time: int):
+    """
+    Process pool initializer: open this worker's headless browser and copy the parent's login
+    cookies into it. driver_path is the parent's resolved ChromeDriver, reused instead of
+    resolving it again. The browser is closed when the worker exits (atexit doesn't run in
+    pool workers, multiprocessing finalizers do).
+    """
+    global _chromedriver_path, _worker_scraper, _worker_expand_rows
+    _chromedriver_path = driver_path
+    _worker_expand_rows = expand_rows
+    _worker_scraper = ChronicleScraper(headless=True, wait_time=wait_time, fast=fast, page_url=page_url,
+                                       block_resources=block_resources)
+    multiprocessing.util.Finalize(None, _close_browser_worker, exitpriority=10)
+    # Cookies can only be set for the domain currently loaded
+    _worker_scraper.open_table()
+    for cookie in cookies:
+        try:
+            _worker_scraper.driver.add_cookie({k: cookie[k] for k in ('name', 'value', 'domain', 'path', 'secure')
+                                               if k in cookie})
+        except Exception as e:
+            logger.debug(f"Could not copy cookie {cookie.get('name')}: {e}")
+
+
+def _close_browser_worker():
+    _worker_scraper.close()
+    BROWSER_POOL.shutdown()
+
+
+def _scrape_page_worker(page_num: int) -> List[Dict]:
+    """
+    Scrape one page in this worker process's browser (top-level so process pools can pickle it).
+    Waits for the table's rows, like the tabs path, so a page that is still rendering isn't
+    read as empty (which would end an unknown-length scrape early).
+    """
+    scraper = _worker_scraper
+    scraper.driver.get(scraper.page_url.format(page=page_num))
+    WebDriverWait(scraper.driver, scraper.wait_time, poll_frequency=WAIT_POLL).until(
+        EC.presence_of_element_located((By.CSS_SELECTOR, "tr.result")))
+    if _worker_expand_rows:
+        scraper.expand_all_rows()
+    return scraper.extract_page_rows() or []
+
+
+def positive_int(value: str) -> int:
+    """argparse type for options that must be at least 1."""
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {value}")
+    return number
+
+
 def main():
     """Main function to run the scraper."""
-    import argparse
-    
     parser = argparse.ArgumentParser(description='Scrape Chronicle DEI tracking table')
     parser.add_argument('--email', type=str, default=None, help='Chronicle account email')
     parser.add_argument('--password', type=str, default=None, help='Chronicle account password')
     parser.add_argument('--headless', action='store_true', help='Run browser in headless mode')
+    parser.add_argument('--engine', choices=['selenium', 'playwright'], default='selenium',
+                        help='Browser automation library (playwright needs: pip install playwright && playwright install chromium)')
+    parser.add_argument('--no-block-resources', action='store_true',
+                        help='Load images, fonts and analytics scripts (blocked by default for faster page loads)')
     parser.add_argument('--no-expand', action='store_true', help='Do not expand rows for details')
     parser.add_argument('--no-display', action='store_true', help='Do not display table in terminal')
     parser.add_argument('--fast', action='store_true', help='Use shorter delays (faster scrape)')
     parser.add_argument('--max-pages', type=int, default=None, help='Stop after this many pages (e.g. 1 for quick test)')
+    parser.add_argument('--page-url', type=str, default=None,
+                        help="URL template with {page} for the table's page endpoint; fetches pages concurrently with aiohttp")
+    parser.add_argument('--concurrency', type=positive_int, default=8, help='Maximum page requests in flight with --page-url')
+    parser.add_argument('--workers', type=positive_int, default=1, help='Render --page-url pages in this many parallel headless browsers')
+    parser.add_argument('--tabs', type=positive_int, default=1, help='Load --page-url pages this many tabs at a time in one browser')
+    parser.add_argument('--max-retries', type=positive_int, default=5, help='Attempts per page with --page-url before giving up')
     parser.add_argument('--output-csv', type=str, default='chronicle_dei_data.csv', help='Output CSV filename')
     parser.add_argument('--output-json', type=str, default='chronicle_dei_data.json', help='Output JSON filename')
     parser.add_argument('--output-excel', type=str, default='chronicle_dei_data.xlsx', help='Output Excel filename')
+    parser.add_argument('--output-jsonl', type=str, default=None, help='Also stream rows to this JSON Lines file while scraping')
+    parser.add_argument('--stream', action='store_true', help='Write the CSV and JSON page by page while scraping instead of at the end')
     
     args = parser.parse_args()
+    if args.engine == 'playwright' and not PLAYWRIGHT_AVAILABLE:
+        parser.error("playwright not available. Install with: pip install playwright && playwright install chromium")
     
-    scraper = ChronicleScraper(headless=args.headless, fast=args.fast)
+    scraper_class = ChronicleScraperPW if args.engine == 'playwright' else ChronicleScraper
+    scraper = scraper_class(headless=args.headless, fast=args.fast, page_url=args.page_url,
+                            concurrency=args.concurrency, max_retries=args.max_retries,
+                            block_resources=not args.no_block_resources, workers=args.workers,
+                            tabs=args.tabs)
     
     try:
         # Login if credentials provided
@@ -1013,18 +2234,23 @@ def main():
             scraper.login(args.email, args.password)
         else:
             logger.info("No credentials provided. If login is required, please log in manually in the browser.")
-            input("Press Enter after logging in (if needed)...")
+            scraper.open_table()
+            if os.environ.get('INTERACTIVE_LOGIN') == '1':
+                input("Press Enter after logging in (if needed)...")
         
-        # Scrape all data
-        data = scraper.scrape_all(expand_rows=not args.no_expand, max_pages=args.max_pages)
+        # Scrape all data, streaming rows to disk as pages finish if requested
+        with RowStream(args.output_csv if args.stream else None, args.output_jsonl,
+                       args.output_json if args.stream else None) as stream:
+            data = scraper.scrape_all(expand_rows=not args.no_expand, max_pages=args.max_pages, stream=stream)
         
         # Save data (always try to save and show something)
         if data:
             logger.info(f"Saving {len(data)} records to CSV, JSON, and Excel...")
             if not args.no_display:
                 scraper.display_table(data)
-            scraper.save_to_csv(data, args.output_csv)
-            scraper.save_to_json(data, args.output_json)
+            if not args.stream:
+                scraper.save_to_csv(data, args.output_csv)
+                scraper.save_to_json(data, args.output_json)
             if PANDAS_AVAILABLE:
                 scraper.save_to_excel(data, args.output_excel)
             logger.info(f"Done. Output files: {args.output_csv}, {args.output_json}, {args.output_excel}")
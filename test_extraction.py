@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Checks that the HTML parser backends and output writers agree on a sample page.
+Run with: python3 -m pytest test_extraction.py
+"""
+
+import csv
+import json
+
+import pytest
+
+import scraper
+from scraper import ChronicleScraper, RowStream, parse_details_text
+
+SAMPLE_PAGE = """<html><head><script>var x = "<tr>";</script><style>.a{}</style></head><body>
+<nav><a href="/login">Log In</a></nav>
+<div class="pagination-info">Showing 1–25 of 60</div>
+<table><thead><tr><th>Institution</th><th>State</th><th>Impacts</th><th>Source</th></tr></thead>
+<tbody>
+<tr class="result opened" id="228"><td><span class="icon-chevron"></span>University of Alpha</td><td>Texas</td><td>Jobs; training</td><td><a href="https://example.com/a">Texas Tribune</a>, <a href="https://example.com/b">KUT</a></td></tr>
+<tr id="details_228"><td class="details" colspan="4"><b>Details</b><br>"Closed the DEI office and eliminated 20 positions."<br><b>State status:</b> "Legislation passed"</td></tr>
+<tr class="result" id="229"><td>Beta College</td><td>Ohio</td><td>Other DEI-related activities</td><td>News release</td></tr>
+<tr id="details_229"><td class="details" colspan="4"><b>Details</b><br>Renamed office.<br>More text here.<br><b>State status: Pending bill</b></td></tr>
+<tr class="result" id="230"><td>Gamma Inst</td><td>Utah</td><td>Jobs</td><td><a href="https://example.com/c">Deseret</a></td></tr>
+<tr class="result" id="231"><td>Delta U</td><td>Iowa</td><td>Training</td><td>Memo</td></tr>
+<tr id="details_231"><td class="details" colspan="4"><b>Details</b><br>Short note.</td></tr>
+<tr class="result" id="232"><td>Foo <em>Univ</em></td><td> New
+ York </td><td>Jobs</td><td><a href="/news/1">Local</a> and <a href="">blank</a><a>none</a></td></tr>
+<tr id="details_232"><td class="details" colspan="4"><p><b>Details</b> Inline after heading</p><p>Second <i>para</i></p><p><b>State status:</b> "Signed" into law</p></td></tr>
+</tbody></table>
+<footer><p>foot</p></footer>
+</body></html>"""
+
+
+def soup_rows():
+    soup = scraper.BeautifulSoup(SAMPLE_PAGE, scraper.BS4_PARSER)
+    return ChronicleScraper.extract_rows_from_soup(soup)
+
+
+def test_soup_rows():
+    """The BeautifulSoup path reads every result row with its details."""
+    rows = soup_rows()
+    assert [row['row_id'] for row in rows] == ['228', '229', '230', '231', '232']
+    assert rows[0]['source_links'] == ['https://example.com/a', 'https://example.com/b']
+    assert rows[0]['details'] == 'Closed the DEI office and eliminated 20 positions.'
+    assert rows[0]['state_status'] == 'Legislation passed'
+    assert rows[2]['details'] == '' and rows[2]['state_status'] == ''
+    assert rows[4]['institution'] == 'FooUniv'
+    assert rows[4]['source_links'] == ['/news/1', '']
+
+
+def test_strained_soup_matches_full_soup():
+    """Parsing only <tr> elements doesn't change the rows."""
+    soup = scraper.BeautifulSoup(SAMPLE_PAGE, scraper.BS4_PARSER, parse_only=scraper.SoupStrainer('tr'))
+    assert ChronicleScraper.extract_rows_from_soup(soup) == soup_rows()
+
+
+@pytest.mark.skipif(not scraper.SELECTOLAX_AVAILABLE, reason="selectolax not installed")
+def test_selectolax_matches_soup():
+    assert ChronicleScraper.extract_rows_from_tree(scraper.HTMLParser(SAMPLE_PAGE)) == soup_rows()
+
+
+@pytest.mark.skipif(not scraper.LXML_AVAILABLE, reason="lxml not installed")
+def test_lxml_matches_soup():
+    assert ChronicleScraper.extract_rows_from_lxml(scraper.lxml.html.fromstring(SAMPLE_PAGE)) == soup_rows()
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("Details\n\"Closed the office.\"\nState status:\n\"Passed\"", ("Closed the office.", "Passed")),
+    ("Details\nLine one.\nLine two.\nState status: Pending\nbill", ("Line one. Line two.", "Pending bill")),
+    ("Details\nOnly details.", ("Only details.", "")),
+    # No Details heading: everything before the status is details
+    ("Renamed office.\nState status: Signed", ("Renamed office.", "Signed")),
+    ("Just a note.", ("Just a note.", "")),
+    ("", ("", "")),
+    ("  \n\n  ", ("", "")),
+])
+def test_parse_details_text(text, expected):
+    assert parse_details_text(text) == expected
+
+
+def test_row_stream_json_matches_json_dump(tmp_path):
+    """Streaming the JSON array page by page writes what json.dump(indent=2) would."""
+    rows = soup_rows()
+    for data in ([], rows):
+        path = tmp_path / 'stream.json'
+        with RowStream(json_path=str(path)) as stream:
+            stream.write_rows(data[:2])
+            stream.write_rows(data[2:])
+        assert path.read_text(encoding='utf-8') == json.dumps(data, indent=2, ensure_ascii=False)
+
+
+def test_row_stream_csv_matches_save_to_csv(tmp_path, monkeypatch):
+    """The CSV writers (streamed, pandas and DictWriter) produce the same file."""
+    rows = soup_rows()
+    streamed = tmp_path / 'stream.csv'
+    with RowStream(csv_path=str(streamed)) as stream:
+        stream.write_rows(rows)
+
+    s = ChronicleScraper.__new__(ChronicleScraper)
+    monkeypatch.setattr(scraper, 'PANDAS_AVAILABLE', False)
+    plain = tmp_path / 'plain.csv'
+    s.save_to_csv(rows, str(plain))
+    assert plain.read_bytes() == streamed.read_bytes()
+    with open(plain, newline='', encoding='utf-8') as f:
+        assert [row['row_id'] for row in csv.DictReader(f)] == [row['row_id'] for row in rows]
+
+    if getattr(scraper, 'pd', None) is not None:
+        monkeypatch.setattr(scraper, 'PANDAS_AVAILABLE', True)
+        frame = tmp_path / 'pandas.csv'
+        s.save_to_csv(rows, str(frame))
+        assert frame.read_bytes() == plain.read_bytes()
@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+Checks the concurrent page_url fetching paths against a local HTTP server.
+Run with: python3 -m pytest test_fetching.py
+"""
+
+import asyncio
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+import scraper
+from scraper import ChronicleScraper, RowStream
+
+pytestmark = pytest.mark.skipif(not scraper.AIOHTTP_AVAILABLE, reason="aiohttp not installed")
+
+
+def table_page(page_num: int, rows: int = 2) -> str:
+    """A table page whose row ids encode the page number (page 3 -> ids 301, 302, ...)."""
+    body = ''.join(
+        f'<tr class="result" id="{page_num}{i:02d}"><td>Institution {page_num}-{i}</td><td>State</td>'
+        f'<td>Impacts</td><td><a href="/source/{page_num}/{i}">Source</a></td></tr>'
+        f'<tr id="details_{page_num}{i:02d}"><td class="details"><b>Details</b><br>Page {page_num} row {i}</td></tr>'
+        for i in range(1, rows + 1))
+    return f'<html><body><table><tbody>{body}</tbody></table></body></html>'
+
+
+class PageServer:
+    """
+    Serves table_page(n) at /table?page=n. Responses can be scripted per page (status,
+    headers, delay) and every request is recorded in hits.
+    """
+
+    def __init__(self):
+        self.hits = []
+        self.last_page = 100
+        self.delays = {}  # page -> seconds to wait before answering
+        self.scripted = {}  # page -> list of (status, headers) answered before the real page
+        self._lock = threading.Lock()
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                page_num = int(parse_qs(urlparse(self.path).query)['page'][0])
+                with server._lock:
+                    server.hits.append(page_num)
+                    scripted = server.scripted.get(page_num)
+                    status, headers = scripted.pop(0) if scripted else (200, {})
+                time.sleep(server.delays.get(page_num, 0))
+                body = b''
+                if status == 200:
+                    html = table_page(page_num) if page_num <= server.last_page else '<html><body></body></html>'
+                    body = html.encode('utf-8')
+                self.send_response(status)
+                for name, value in {'Content-Type': 'text/html; charset=utf-8', **headers}.items():
+                    self.send_header(name, value)
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        self._httpd = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self.url = f"http://127.0.0.1:{self._httpd.server_address[1]}/table?page={{page}}"
+        threading.Thread(target=self._httpd.serve_forever, daemon=True).start()
+
+    def close(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+
+@pytest.fixture
+def page_server():
+    server = PageServer()
+    yield server
+    server.close()
+
+
+def make_scraper(page_url: str, cls=ChronicleScraper, **options) -> ChronicleScraper:
+    """A ChronicleScraper (or subclass) for page_url fetching, without launching a browser."""
+    s = cls.__new__(cls)
+    settings = dict(page_url=page_url, concurrency=4, max_retries=3, fast=True, wait_time=2,
+                    workers=1, tabs=1, block_resources=True, session=None, driver=None)
+    settings.update(options)
+    for name, value in settings.items():
+        setattr(s, name, value)
+    s.get_session_cookies = lambda: {'session': 'abc'}
+    return s
+
+
+def fetch(s: ChronicleScraper, page_num: int) -> str:
+    async def run():
+        async with s:
+            return await s.fetch_page(page_num)
+    return asyncio.run(run())
+
+
+def test_fetch_page_retries_rate_limits(page_server):
+    page_server.scripted[2] = [(429, {'Retry-After': '0'}), (503, {'Retry-After': '0'})]
+    html = fetch(make_scraper(page_server.url), 2)
+    assert 'id="201"' in html
+    assert page_server.hits == [2, 2, 2]
+
+
+def test_fetch_page_gives_up_after_max_retries(page_server):
+    page_server.scripted[1] = [(503, {'Retry-After': '0'})] * 5
+    with pytest.raises(scraper.aiohttp.ClientError, match="giving up after 2 attempts"):
+        fetch(make_scraper(page_server.url, max_retries=2), 1)
+    assert page_server.hits == [1, 1]
+
+
+def test_fetch_page_does_not_retry_client_errors(page_server):
+    page_server.scripted[1] = [(404, {})]
+    with pytest.raises(scraper.aiohttp.ClientResponseError):
+        fetch(make_scraper(page_server.url), 1)
+    assert page_server.hits == [1]
+
+
+@pytest.mark.skipif(not scraper.HTML_PARSER_AVAILABLE, reason="no HTML parser installed")
+def test_streamed_pages_keep_page_order(page_server, tmp_path):
+    """Pages that finish out of order are still streamed in page order, matching the returned rows."""
+    page_server.last_page = 5
+    page_server.delays = {1: 0.5, 3: 0.2}
+    s = make_scraper(page_server.url, concurrency=4)
+    path = tmp_path / 'stream.json'
+    with RowStream(json_path=str(path)) as stream:
+        data = s._scrape_pages_over_http(None, stream=stream)
+    assert [row['row_id'] for row in data] == [f"{page}{i:02d}" for page in range(1, 6) for i in (1, 2)]
+    assert path.read_text(encoding='utf-8') == json.dumps(data, indent=2, ensure_ascii=False)
+
+
+@pytest.mark.skipif(not (scraper.PLAYWRIGHT_AVAILABLE and scraper.HTML_PARSER_AVAILABLE),
+                    reason="playwright or HTML parser not installed")
+def test_page_url_fetch_with_playwright_loop_running(page_server):
+    """Playwright's sync API keeps an event loop running in this thread; page_url fetching still works."""
+    page_server.last_page = 3
+    cookie_threads = []
+    s = make_scraper(page_server.url, cls=scraper.ChronicleScraperPW)
+    # Sync Playwright calls (like BrowserContext.cookies) only work outside the fetch loop, in this thread
+    s.get_session_cookies = lambda: cookie_threads.append(threading.current_thread()) or {}
+    playwright = scraper.sync_playwright().start()
+    try:
+        data = s._scrape_pages_over_http(None)
+    finally:
+        playwright.stop()
+    assert [row['row_id'] for row in data] == [f"{page}{i:02d}" for page in range(1, 4) for i in (1, 2)]
+    assert cookie_threads == [threading.main_thread()]
+
+
+def test_row_stream_flushes_out_of_order_pages(tmp_path):
+    path = tmp_path / 'stream.jsonl'
+    with RowStream(jsonl_path=str(path)) as stream:
+        stream.write_page(2, [{'row_id': '2'}])
+        assert path.read_text(encoding='utf-8') == ''
+        stream.write_page(1, [{'row_id': '1'}])
+        stream.write_page(4, [{'row_id': '4'}])
+    assert [json.loads(line)['row_id'] for line in path.read_text(encoding='utf-8').splitlines()] == ['1', '2', '4']
+
+
+@pytest.mark.parametrize("option", ['concurrency', 'max_retries', 'workers', 'tabs'])
+def test_rejects_options_below_one(option):
+    # Checked before any browser is launched
+    with pytest.raises(ValueError, match=option):
+        ChronicleScraper(**{option: 0})
@@ -24,6 +24,12 @@ def test_imports():
     except ImportError as e:
         errors.append(f"✗ beautifulsoup4 not installed: {e}")
     
+    try:
+        import lxml
+        print("✓ lxml installed")
+    except ImportError as e:
+        errors.append(f"✗ lxml not installed: {e}")
+    
     try:
         import pandas as pd
         print("✓ pandas installed")
@@ -42,6 +48,12 @@ def test_imports():
     except ImportError as e:
         errors.append(f"✗ webdriver-manager not installed: {e}")
     
+    try:
+        import orjson
+        print("✓ orjson installed")
+    except ImportError:
+        print("- orjson not installed (optional, speeds up JSON output)")
+    
     if errors:
         print("\n❌ Some packages are missing!")
         print("\nInstall missing packages with:")
@@ -80,7 +92,7 @@ def main():
         print()
         print("Next steps:")
         print("  1. Run: python3 scraper.py --email YOUR_EMAIL --password YOUR_PASSWORD")
-        print("  2. Or run: python3 scraper.py  (for manual login)")
+        print("  2. Or run: INTERACTIVE_LOGIN=1 python3 scraper.py  (for manual login)")
         print()
     else:
         print("❌ Some tests failed. Please install missing dependencies.")